@@ -1,11 +1,19 @@
 """Unit tests for V"""
+import copy
 import os
+import pickle
 import random
 import datetime
+import tempfile
 import unittest
+from concurrent.futures import ThreadPoolExecutor
+from unittest import mock
+
+import requests
+
 import vistos as v
 
-from vistos.src.gpo import util, fields, option
+from vistos.src.gpo import util, fields, option, cache, govinfo, bioguide
 
 random.seed(43)
 
@@ -185,6 +193,175 @@ class VistosUnitTests(unittest.TestCase):
         self.assertFalse(option.is_valid_bioguide_state('123456'))
         self.assertFalse(option.is_valid_bioguide_party('123456'))
 
+    def test_option_values(self):
+        """Verify the option values that were once shadowed or miscoded"""
+        self.assertEqual(option.State.ARKANSAS, 'AR')
+        self.assertEqual(option.State.IDAHO, 'ID')
+        self.assertEqual(option.State.MONTANA, 'MT')
+        self.assertEqual(option.State.ILLINOIS, 'IL')
+        self.assertEqual(option.State.INDIANA, 'IN')
+
+        for state in ('AR', 'ID', 'IL', 'IN', 'MT', 'AK', 'MN'):
+            self.assertTrue(option.is_valid_bioguide_state(state))
+
+        self.assertEqual(option.Party.Historical.AMERICAN, 'American')
+        self.assertEqual(option.Party.Historical.AMERICAN_KNOW_NOTHING,
+                         'American (Know-Nothing)')
+        self.assertTrue(option.is_valid_bioguide_party('American'))
+        self.assertTrue(
+            option.is_valid_bioguide_party('American (Know-Nothing)'))
+
+    def test_cache_funcs(self):
+        """Verify that records are only cached while caching is enabled"""
+        with tempfile.TemporaryDirectory() as cache_dir:
+            cache.put_text(cache.BIOGUIDE, 'A000000', '<member/>')
+            self.assertIsNone(cache.get_text(cache.BIOGUIDE, 'A000000'))
+
+            v.gpo.enable_cache(cache_dir)
+            try:
+                cache.put_text(cache.BIOGUIDE, 'A000000', '<member/>')
+                self.assertEqual(cache.get_text(cache.BIOGUIDE, 'A000000'),
+                                 '<member/>')
+
+                v.gpo.clear_cache()
+                self.assertIsNone(cache.get_text(cache.BIOGUIDE, 'A000000'))
+            finally:
+                v.gpo.disable_cache()
+
+    def test_cdir_error_responses_not_cached(self):
+        """Verify that only successful granule summaries are cached"""
+        def create_response(status_code, text):
+            response = requests.Response()
+            response.status_code = status_code
+            response._content = text.encode('utf-8')
+            return response
+
+        packages = [{'packageId': 'CDIR-1', 'dateIssued': '2020-01-01'}]
+        granules = [{'granuleId': 'G1', 'granuleClass': 'CONGRESSMEMBERSTATE'}]
+        rate_limited = create_response(429, '{"error": "rate limited"}')
+        summary = create_response(200, '{"subGranuleClass": "SENATOR"}')
+
+        with tempfile.TemporaryDirectory() as cache_dir:
+            v.gpo.enable_cache(cache_dir)
+            try:
+                with mock.patch.object(govinfo, '_cdir_data_exists',
+                                       return_value=True), \
+                        mock.patch.object(govinfo, '_packages_by_congress',
+                                          return_value=packages), \
+                        mock.patch.object(govinfo, '_granules',
+                                          return_value=granules), \
+                        mock.patch.object(govinfo, '_get_response_from',
+                                          side_effect=[rate_limited,
+                                                       summary]):
+                    record = govinfo._get_cdir('KEY', 116)
+                    self.assertEqual(len(record.members), 0)
+                    self.assertIsNone(cache.get_text(cache.GOVINFO, 'G1'))
+
+                    record = govinfo._get_cdir('KEY', 116)
+                    self.assertEqual(len(record.members), 1)
+                    self.assertEqual(cache.get_text(cache.GOVINFO, 'G1'),
+                                     summary.text)
+            finally:
+                v.gpo.disable_cache()
+
+    def test_congress_member_reuse(self):
+        """Verify that asking for a member again returns the live object,
+        without resetting its data"""
+        member = v.CongressMember('a000004', load_immediately=False)
+        self.assertIs(v.CongressMember('A000004', load_immediately=False),
+                      member)
+
+        record = object()
+        member._bg = record
+        v.CongressMember('A000004', load_immediately=False)
+        self.assertIs(member._bg, record)
+
+        # threads creating the same member all receive one object
+        with ThreadPoolExecutor(8) as executor:
+            members = list(executor.map(
+                lambda _: v.CongressMember('A000005',
+                                           load_immediately=False),
+                range(32)))
+        self.assertEqual(len(set(map(id, members))), 1)
+
+    def test_congress_member_copy(self):
+        """Verify that copies of a member are separate objects holding the
+        same data"""
+        member = v.CongressMember('a000001', load_immediately=False)
+
+        for member_copy in (copy.copy(member), copy.deepcopy(member)):
+            self.assertIsNot(member_copy, member)
+            self.assertIsInstance(member_copy, v.CongressMember)
+            self.assertEqual(member_copy.bioguide_id, 'A000001')
+            self.assertIs(v.CongressMember('A000001', load_immediately=False),
+                          member)
+
+    def test_congress_pickle_and_copy(self):
+        """Verify that pickling a Congress reuses its downloaded data, and
+        that copies are separate objects"""
+        record = bioguide.BioguideCongressRecord(
+            3, bioguide.BioguideMemberList([]))
+        load_bioguide = mock.Mock(return_value=record)
+
+        with mock.patch.object(bioguide, 'create_bioguide_func',
+                               return_value=load_bioguide):
+            congress = v.Congress(3)
+
+            restored = pickle.loads(pickle.dumps(congress))
+            self.assertEqual(restored.number, 3)
+            self.assertEqual(restored.bioguide, record)
+
+            congress_copy = copy.copy(congress)
+            self.assertIsNot(congress_copy, congress)
+            self.assertIs(congress_copy.bioguide, congress.bioguide)
+
+            congress_deepcopy = copy.deepcopy(congress)
+            self.assertIsNot(congress_deepcopy, congress)
+            self.assertIsNot(congress_deepcopy.bioguide, congress.bioguide)
+            self.assertEqual(congress_deepcopy.bioguide, record)
+
+        self.assertEqual(load_bioguide.call_count, 1)
+
+    def test_member_records_reloaded(self):
+        """Verify that member records kept in memory are loaded again once
+        they expire or the cache is cleared"""
+        with mock.patch.object(bioguide, '_query_member_by_id',
+                               side_effect=lambda _: object()) as query, \
+                tempfile.TemporaryDirectory() as cache_dir:
+            load_member = bioguide.create_bioguide_member_func('A000002')
+            record = load_member()
+            self.assertIs(load_member(), record)
+            self.assertEqual(query.call_count, 1)
+
+            v.gpo.clear_cache(cache_dir)
+            self.assertIsNot(load_member(), record)
+            self.assertEqual(query.call_count, 2)
+
+            v.gpo.enable_cache(cache_dir, expire_after=60)
+            try:
+                load_member = bioguide.create_bioguide_member_func('A000003')
+                now = [0]
+                with mock.patch.object(bioguide, '_clock',
+                                       lambda: now[0]):
+                    record = load_member()
+                    now[0] = 30
+                    self.assertIs(load_member(), record)
+                    now[0] = 100
+                    self.assertIsNot(load_member(), record)
+                self.assertEqual(query.call_count, 4)
+            finally:
+                v.gpo.disable_cache()
+
+    def test_govinfo_checks_only_remember_found_data(self):
+        """Verify that a Congress without GovInfo data is checked again,
+        while one with data is only checked once"""
+        with mock.patch.object(govinfo, '_cdir_data_exists',
+                               side_effect=[False, True]) as cdir_exists:
+            self.assertFalse(govinfo.check_for_govinfo(900, 'KEY'))
+            self.assertTrue(govinfo.check_for_govinfo(900, 'KEY'))
+            self.assertTrue(govinfo.check_for_govinfo(900, 'KEY'))
+            self.assertEqual(cdir_exists.call_count, 2)
+
 
 if __name__ == '__main__':
     unittest.main()
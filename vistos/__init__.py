@@ -3,9 +3,11 @@
 from os import path as _path
 
 from vistos.src import (Congress, CongressMember, CongressBills,
-                        search_bioguide_members, search_govinfo_members, gpo)
+                        search_bioguide_members, iter_bioguide_members,
+                        search_govinfo_members, gpo)
 
 __all__ = ['gpo', 'Congress', 'CongressMember', 'CongressBills',
-           'search_bioguide_members', 'search_govinfo_members']
+           'search_bioguide_members', 'iter_bioguide_members',
+           'search_govinfo_members']
 
 VERSION = open(_path.join(_path.dirname(__file__), 'VERSION'), 'r').read()
@@ -1,6 +1,8 @@
 """Backbone for V module"""
 from vistos.src.duo import (Congress, CongressMember, CongressBills,
-                            search_bioguide_members, search_govinfo_members)
+                            search_bioguide_members, iter_bioguide_members,
+                            search_govinfo_members)
 
 __all__ = ['Congress', 'CongressMember', 'CongressBills',
-           'search_bioguide_members', 'search_govinfo_members']
+           'search_bioguide_members', 'iter_bioguide_members',
+           'search_govinfo_members']
@@ -1,22 +1,60 @@
 """Legislative"""
+import copy
+import threading
+import weakref
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
+from functools import partial
+from operator import attrgetter
 
 import vistos.src.gpo as gpo
 
+# shared pool for background requests, like the GovInfo existence checks,
+# so that each Congress doesn't have to spin up its own threads. The tasks
+# wait on the network, so the pool is sized like the gpo request pools
+_EXECUTOR = ThreadPoolExecutor(gpo.util.NUMBER_OF_REQUEST_THREADS)
+
+# live objects by their constructor arguments, so that asking for the same
+# member or Congress again returns the object that already holds its data
+_MEMBER_CACHE = weakref.WeakValueDictionary()
+_MEMBER_CACHE_LOCK = threading.Lock()
+_CONGRESS_CACHE = weakref.WeakValueDictionary()
+_CONGRESS_CACHE_LOCK = threading.Lock()
+
+# background loading of neighboring Congresses (see
+# `Congress.prefetch_neighbors`), limited to two downloads at a time. The
+# downloads run on daemon threads, so that exiting never waits on them
+_PREFETCH_SLOTS = threading.BoundedSemaphore(2)
+_PREFETCH_LOCK = threading.Lock()
+_PREFETCHES = dict()
+
+# the weak cache alone would drop a prefetched Congress before it's used,
+# so the most recently prefetched ones are also held here
+_PREFETCHED = deque(maxlen=4)
+
+# the fields a Bioguide record must have to be accepted by a setter
+_REQUIRED_MEMBER_FIELDS = \
+    attrgetter('bioguide_id', 'first_name', 'last_name', 'terms')
+_REQUIRED_CONGRESS_FIELDS = \
+    attrgetter('number', 'start_year', 'end_year', 'members')
+
 
 def search_bioguide_members(first_name=None, last_name=None, position=None,
                             party=None, state=None, congress=None):
     """queries the Bioguide for a list congress members based on the given
     search criteria"""
-    bg_args = (first_name, last_name, position, party, state, congress)
-    member_bioguides = gpo.bioguide.create_bioguide_members_func(*bg_args)()
+    return list(iter_bioguide_members(first_name, last_name, position,
+                                      party, state, congress))
 
-    members_list = list()
-    for bioguide in member_bioguides:
-        member = CongressMember(bioguide.bioguide_id, load_immediately=False)
-        member.bioguide = bioguide
-        members_list.append(member)
 
-    return members_list
+def iter_bioguide_members(first_name=None, last_name=None, position=None,
+                          party=None, state=None, congress=None):
+    """queries the Bioguide for congress members based on the given search
+    criteria, yielding each member as it's needed rather than building the
+    full list"""
+    bg_args = (first_name, last_name, position, party, state, congress)
+    member_bioguides = gpo.bioguide.create_bioguide_members_func(*bg_args)()
+    yield from _iter_members(member_bioguides)
 
 
 def search_govinfo_members(govinfo_api_key, first_name=None, last_name=None,
@@ -27,21 +65,131 @@ def search_govinfo_members(govinfo_api_key, first_name=None, last_name=None,
 
     bg_args = (first_name, last_name, position, party, state, congress)
     member_bioguides = gpo.bioguide.create_bioguide_members_func(*bg_args)()
+    members_list = list(_iter_members(member_bioguides, govinfo_api_key))
+
+    _load_members_govinfo(govinfo_api_key, members_list)
 
-    members_list = list()
+    return members_list
+
+
+def _iter_members(member_bioguides, govinfo_api_key=None):
+    """yields a `CongressMember` for each of the given Bioguide records"""
     for bioguide in member_bioguides:
         member = CongressMember(bioguide.bioguide_id, govinfo_api_key,
                                 load_immediately=False)
         member.bioguide = bioguide
-        member.update()
-        members_list.append(member)
+        yield member
+
+
+def _load_members_govinfo(govinfo_api_key, members):
+    """Loads the GovInfo data of the given members in a single batch"""
+    # members that are already in use may have their data loaded
+    members = [member for member in members
+               if not member._gi and member._bg]
+    if not members:
+        return
+
+    # members of the same Congress share a directory, so loading them
+    # together avoids listing that directory once per member
+    load_members_gi = gpo.govinfo.create_members_cdir_func(govinfo_api_key)
+    member_govinfos = load_members_gi([member._bg for member in members])
+
+    for member, member_govinfo in zip(members, member_govinfos):
+        member._gi = member_govinfo
+
+
+def _bioguide_property(attribute, doc):
+    """Returns a read-only property that reads the given attribute from a
+    member's Bioguide record, or `None` when no record is loaded"""
+    get_attribute = attrgetter(attribute)
+
+    def getter(self):
+        bioguide = self._bg
+        return get_attribute(bioguide) if bioguide is not None else None
+
+    return property(getter, doc=doc)
 
-    return members_list
+
+def _prefetch_congress(key):
+    """Starts loading the Congress for the given cache key in the background,
+    unless it already exists or is being loaded"""
+    with _PREFETCH_LOCK:
+        if key in _PREFETCHES or key in _CONGRESS_CACHE:
+            return
+        future = Future()
+        _PREFETCHES[key] = future
+
+    future.add_done_callback(partial(_finish_prefetch, key))
+    threading.Thread(target=_run_prefetch, args=(key, future),
+                     daemon=True).start()
+
+
+def _run_prefetch(key, future):
+    """Loads the Congress for the given cache key once a download slot is
+    free, reporting the outcome through the given future"""
+    with _PREFETCH_SLOTS:
+        try:
+            congress = _load_congress(*key)
+        except BaseException as err:
+            future.set_exception(err)
+        else:
+            future.set_result(congress)
+
+
+def _load_congress(number, govinfo_api_key, include_bioguide):
+    """Creates and loads a Congress without prefetching its neighbors"""
+    congress = Congress(number, govinfo_api_key, include_bioguide,
+                        load_immediately=False)
+    congress._load_once()
+    return congress
+
+
+def _finish_prefetch(key, future):
+    """Holds onto a prefetched Congress until it's requested"""
+    with _PREFETCH_LOCK:
+        del _PREFETCHES[key]
+        if future.exception() is None:
+            _PREFETCHED.append(future.result())
+
+
+def _restore_congress(key, enabled, datasets):
+    """Rebuilds a pickled Congress (see `Congress.__reduce__`), without
+    repeating the GovInfo checks or downloads made by the original"""
+    number, govinfo_api_key, _ = key
+    enable_bioguide, enable_govinfo, enable_bills = enabled
+
+    congress = Congress.__new__(Congress, *key)
+    with congress._lock:
+        if not congress._initialized:
+            congress._reset()
+
+            if enable_bioguide:
+                congress._enable_bioguide()
+            if enable_govinfo:
+                congress._enable_govinfo(govinfo_api_key)
+            if enable_bills:
+                congress._bills = \
+                    CongressBills(number, govinfo_api_key, False)
+
+            congress._initialized = True
+
+        # keep the data of a Congress that's already loaded in this process
+        if not congress._loaded:
+            bioguide, govinfo, loaded = datasets
+            if bioguide is not None:
+                congress._bg = bioguide
+            if govinfo is not None:
+                congress._gi = govinfo
+            congress._loaded = loaded
+
+    return congress
 
 
 class CongressBills(list):
     """An object for downloading bills for a single Congress"""
 
+    __slots__ = ('_bills', '_number', '_years', '_load_bills')
+
     def __init__(self, congress_number, govinfo_api_key,
                  load_immediately=True):
         self._bills = None
@@ -56,17 +204,49 @@ class CongressBills(list):
             self.load()
 
     def load(self):
-        for bill in self._load_bills():
-            self.append(bill)
+        self.extend(self._load_bills())
 
 
 class CongressMember:
     """An object for downloading a single Congress member"""
 
+    __slots__ = ('_bg', '_gi', '_bills', '_bg_id', '_load_member_bg',
+                 '_load_member_gi', '_initialized', 'complete_govinfo',
+                 '__weakref__')
+
+    def __new__(cls, bioguide_id=None, govinfo_api_key=None,
+                load_immediately=True):
+        # copies are created without arguments, and are never cached
+        if bioguide_id is None:
+            member = super().__new__(cls)
+            member._initialized = False
+            return member
+
+        key = (str(bioguide_id).upper(), govinfo_api_key)
+        with _MEMBER_CACHE_LOCK:
+            member = _MEMBER_CACHE.get(key)
+            if member is None:
+                member = super().__new__(cls)
+                member._initialized = False
+                _MEMBER_CACHE[key] = member
+        return member
+
     def __init__(self, bioguide_id, govinfo_api_key=None,
                  load_immediately=True):
+        # a cached member may be initializing on another thread, and must
+        # only be initialized once so that its loaded data isn't reset
+        with _MEMBER_CACHE_LOCK:
+            if not self._initialized:
+                self._initialize(bioguide_id, govinfo_api_key)
+
+        if load_immediately and self._bg is None:
+            self.load()
+
+    def _initialize(self, bioguide_id, govinfo_api_key):
+        """Set up the datasets and loaders of this member"""
         self._bg = None
         self._gi = None
+        self._bills = None
 
         self._bg_id = None
 
@@ -75,22 +255,18 @@ class CongressMember:
 
         self.complete_govinfo = True
 
+        # the Bioguide loader is created by the first load, since members
+        # built from search results are handed their records directly
         if bioguide_id is not None:
             self._bg_id = str(bioguide_id).upper()
-            self._enable_bioguide()
 
         if govinfo_api_key is not None:
             self._enable_govinfo(govinfo_api_key)
 
-        if load_immediately:
-            self.load()
+        self._initialized = True
 
     def __str__(self):
-        if self._bg_id is None:
-            bioguide_id = 'Unknown'
-        else:
-            bioguide_id = self._bg_id
-
+        bioguide_id = self._bg_id if self._bg_id is not None else 'Unknown'
         return f'CongressMember<{bioguide_id}>'
 
     def load(self):
@@ -108,6 +284,9 @@ class CongressMember:
 
     def _load_bioguide(self):
         """Load member Bioguide data"""
+        if self._load_member_bg is None:
+            self._enable_bioguide()
+
         if self._load_member_bg is not None:
             self._bg = self._load_member_bg()
 
@@ -130,10 +309,7 @@ class CongressMember:
     @property
     def bioguide(self):
         """returns Bioguide data as a `BioguideMemberRecord`"""
-        bioguide = None
-        if hasattr(self, '_bg'):
-            bioguide = self._bg
-        return bioguide
+        return self._bg
 
     @property
     def govinfo(self):
@@ -151,12 +327,7 @@ class CongressMember:
 
     @bioguide.setter
     def bioguide(self, new_bioguide):
-        valid_bioguide = bool(new_bioguide.bioguide_id
-                              and new_bioguide.first_name
-                              and new_bioguide.last_name
-                              and new_bioguide.terms)
-
-        if valid_bioguide:
+        if all(_REQUIRED_MEMBER_FIELDS(new_bioguide)):
             self._bg = new_bioguide
             self._bg_id = new_bioguide.bioguide_id
         else:
@@ -191,100 +362,118 @@ class CongressMember:
     @property
     def bioguide_id(self):
         """The Bioguide ID of the Congress member"""
-        bioguide_id = None
-        if hasattr(self, '_bg_id'):
-            bioguide_id = self._bg_id
-        return bioguide_id
+        return self._bg_id
 
-    @property
-    def first_name(self):
-        """returns the selected Congress member's first name"""
-        first_name = None
-        if hasattr(self, '_bg') and self._bg is not None:
-            first_name = self._bg.first_name
-        return first_name
+    first_name = _bioguide_property(
+        'first_name',
+        """returns the selected Congress member's first name""")
 
-    @property
-    def nickname(self):
-        """returns the selected Congress member's nickname"""
-        nickname = None
-        if hasattr(self, '_bg') and self._bg is not None:
-            nickname = self._bg.nickname
-        return nickname
+    nickname = _bioguide_property(
+        'nickname',
+        """returns the selected Congress member's nickname""")
 
-    @property
-    def last_name(self):
-        """returns the selected Congress member's last name"""
-        last_name = None
-        if hasattr(self, '_bg') and self._bg is not None:
-            last_name = self._bg.last_name
-        return last_name
+    last_name = _bioguide_property(
+        'last_name',
+        """returns the selected Congress member's last name""")
 
-    @property
-    def suffix(self):
-        """returns the suffix of the selected Congress member's name"""
-        suffix = None
-        if hasattr(self, '_bg') and self._bg is not None:
-            suffix = self._bg.suffix
-        return suffix
+    suffix = _bioguide_property(
+        'suffix',
+        """returns the suffix of the selected Congress member's name""")
 
-    @property
-    def birth_year(self):
-        """returns the year that the selected Congress member was born"""
-        birth_year = None
-        if hasattr(self, '_bg') and self._bg is not None:
-            birth_year = self._bg.birth_year
-        return birth_year
+    birth_year = _bioguide_property(
+        'birth_year',
+        """returns the year that the selected Congress member was born""")
 
-    @property
-    def death_year(self):
-        """returns the year that the selected Congress member died"""
-        death_year = None
-        if hasattr(self, '_bg') and self._bg is not None:
-            death_year = self._bg.death_year
-        return death_year
+    death_year = _bioguide_property(
+        'death_year',
+        """returns the year that the selected Congress member died""")
 
-    @property
-    def biography(self):
-        """returns biographical information about the selected Congress member
-        """
-        biography = None
-        if hasattr(self, '_bg') and self._bg is not None:
-            biography = self._bg.biography
-        return biography
+    biography = _bioguide_property(
+        'biography',
+        """returns biographical information about the selected Congress
+        member""")
 
-    @property
-    def terms(self):
+    terms = _bioguide_property(
+        'terms',
         """returns a `list` of `BioguideTermRecord` objects describing all of
-        the terms the selected Congress member served"""
-        terms = None
-        if hasattr(self, '_bg') and self._bg is not None:
-            terms = self._bg.terms
-        return terms
+        the terms the selected Congress member served""")
 
 
 class Congress:
     """An object for downloading a single Congress"""
 
+    __slots__ = ('_gi', '_bg', '_bills', '_bg_index', '_gi_index',
+                 '_members', '_load_bg', '_load_gi', '_load_bills', '_number',
+                 '_start_year', '_end_year', '_key', '_lock', '_loaded',
+                 '_initialized', '__weakref__')
+
+    # when True, loading a Congress also starts loading the Congresses
+    # before and after it in the background, for sequential access
+    prefetch_neighbors = False
+
+    def __new__(cls, number_or_year=None, govinfo_api_key=None,
+                include_bioguide=False, load_immediately=True):
+        number = gpo.convert_to_congress_number(number_or_year)
+        key = (number, govinfo_api_key, include_bioguide)
+
+        with _CONGRESS_CACHE_LOCK:
+            congress = _CONGRESS_CACHE.get(key)
+            if congress is None:
+                congress = super().__new__(cls)
+                congress._key = key
+                congress._lock = threading.RLock()
+                congress._loaded = False
+                congress._initialized = False
+                _CONGRESS_CACHE[key] = congress
+        return congress
+
     def __init__(self, number_or_year=None, govinfo_api_key=None,
                  include_bioguide=False, load_immediately=True):
+        # a cached Congress may be initializing or loading on another thread
+        with self._lock:
+            if not self._initialized:
+                self._initialize(govinfo_api_key, include_bioguide)
+
+        if load_immediately:
+            self._load_once()
+
+            if self.prefetch_neighbors:
+                self._prefetch_neighbors()
+
+    def _reset(self):
+        """Clear the datasets and loaders of this Congress"""
         self._gi = None
         self._bg = None
         self._bills = None
 
+        self._bg_index = None
+        self._gi_index = None
+        self._members = None
+
         self._load_bg = None
         self._load_gi = None
+        self._load_bills = None
 
-        self._number = gpo.convert_to_congress_number(number_or_year)
-        self._years = gpo.get_congress_years(self._number)
+        self._number = self._key[0]
+        self._start_year, self._end_year = \
+            gpo.get_congress_years(self._number)
+
+    def _initialize(self, govinfo_api_key, include_bioguide):
+        """Set up the loaders for the datasets available to this Congress"""
+        self._reset()
 
         if govinfo_api_key is not None:
-            govinfo_data_exists = \
-                gpo.govinfo.check_for_govinfo(self._number, govinfo_api_key)
+            # the checks are independent requests, so send them together
+            govinfo_check = \
+                _EXECUTOR.submit(gpo.govinfo.check_for_govinfo,
+                                 self._number, govinfo_api_key)
+
+            govinfo_bills_check = \
+                _EXECUTOR.submit(gpo.govinfo.check_for_govinfo_bills,
+                                 self._number, govinfo_api_key)
 
-            govinfo_bills_data_exists = \
-                gpo.govinfo.check_for_govinfo_bills(self._number,
-                                                    govinfo_api_key)
+            govinfo_data_exists = govinfo_check.result()
+            govinfo_bills_data_exists = govinfo_bills_check.result()
 
             if govinfo_data_exists:
                 self._enable_govinfo(govinfo_api_key)
@@ -298,19 +487,85 @@ class Congress:
         if include_bioguide or govinfo_api_key is None:
             self._enable_bioguide()
 
-        if load_immediately:
-            self.load()
+        self._initialized = True
 
     def __str__(self):
         return f'Congress<{self.number}>'
 
+    def __reduce__(self):
+        # the loaders can't be pickled, so only the downloaded datasets are
+        # sent, along with which loaders to rebuild once unpickled
+        with self._lock:
+            enabled = (self._load_bg is not None,
+                       self._load_gi is not None,
+                       self._bills is not None)
+            datasets = (self._bg, self._gi, self._loaded)
+        return _restore_congress, (self._key, enabled, datasets)
+
+    def __copy__(self):
+        return self._copy(lambda value: value)
+
+    def __deepcopy__(self, memo):
+        return self._copy(lambda value: copy.deepcopy(value, memo), memo)
+
+    def _copy(self, copy_value, memo=None):
+        """Returns a new Congress holding copies of the attributes of this
+        one. Unlike `__new__`, the cache is bypassed, so that a copy is never
+        the original object"""
+        congress = object.__new__(type(self))
+        if memo is not None:
+            memo[id(self)] = congress
+
+        with self._lock:
+            for name in _COPIED_CONGRESS_SLOTS:
+                setattr(congress, name, copy_value(getattr(self, name)))
+
+        congress._lock = threading.RLock()
+        return congress
+
     def load(self):
         """Manually load datasets specified when instantiating `Congress`"""
+        with self._lock:
+            self._load_datasets()
+
+        if self.prefetch_neighbors:
+            self._prefetch_neighbors()
+
+    def _load_once(self):
+        """Load the datasets, unless they have already been loaded"""
+        with self._lock:
+            if not self._loaded:
+                self._load_datasets()
+
+    def _load_datasets(self):
+        """Download the enabled datasets"""
+        gi_future = None
+
+        # the datasets come from separate services, so the GovInfo data is
+        # downloaded in the background while the Bioguide data loads here
         if self._load_gi is not None:
-            self._gi = self._load_gi()
+            gi_future = _EXECUTOR.submit(self._load_gi)
 
         if self._load_bg is not None:
             self._bg = self._load_bg()
+            self._bg_index = None
+            self._members = None
+
+        if gi_future is not None:
+            self._gi = gi_future.result()
+            self._gi_index = None
+            self._members = None
+
+        self._loaded = True
+
+    def _prefetch_neighbors(self):
+        """Start loading the preceding and following Congresses"""
+        number, govinfo_api_key, include_bioguide = self._key
+        current_congress = gpo.get_current_congress_number()
+        for neighbor in (number - 1, number + 1):
+            if 0 <= neighbor <= current_congress:
+                _prefetch_congress(
+                    (neighbor, govinfo_api_key, include_bioguide))
 
     def load_bills(self):
         """Manually load bills issued during the current Congress"""
@@ -331,54 +586,58 @@ class Congress:
     def get_member_bioguide(self, bioguide_id):
         """returns a `BioguideMemberRecord` corresponding to the given
         Bioguide ID"""
-        if hasattr(self, '_bg') and self._bg is not None:
-            for member in self._bg.members:
-                if member.bioguide_id == bioguide_id:
-                    return member
-        return None
+        return self._bioguide_index().get(bioguide_id) \
+            if self._bg is not None else None
 
     def get_member_govinfo(self, bioguide_id):
         """returns a `dict` containing the GovInfo data corresponding to the
         given Bioguide ID"""
-        if hasattr(self, '_gi') and self._gi is not None:
-            for member in self._gi.members:
-                if member['members'][0]['bioGuideId'] == bioguide_id:
-                    return member
-        return None
+        return self._govinfo_index().get(bioguide_id) \
+            if self._gi is not None else None
+
+    def _bioguide_index(self):
+        """Bioguide member records by Bioguide ID, built on first use"""
+        if self._bg_index is None:
+            # index in reverse so that the first occurrence of an ID wins
+            self._bg_index = {member.bioguide_id: member
+                              for member in reversed(self._bg.members)}
+        return self._bg_index
+
+    def _govinfo_index(self):
+        """GovInfo member records by Bioguide ID, built on first use"""
+        if self._gi_index is None:
+            self._gi_index = dict()
+            for member in reversed(self._gi.members):
+                member_records = member.get('members')
+                if not member_records:
+                    continue
+
+                member_id = member_records[0].get('bioGuideId')
+                if member_id is not None:
+                    self._gi_index[member_id] = member
+        return self._gi_index
 
     @property
     def number(self):
         """an `int` corresponding to the number of the selected Congress"""
-        number = None
-        if hasattr(self, '_number'):
-            number = self._number
-        return number
+        return self._number
 
     @property
     def start_year(self):
         """returns an `int` corresponding to the first year of the selected
         Congress"""
-        start_year = None
-        if hasattr(self, '_years') and len(self._years) > 0:
-            start_year = self._years[0]
-        return start_year
+        return self._start_year
 
     @property
     def end_year(self):
-        """returns an `int` corresponding to the first year of the selected
+        """returns an `int` corresponding to the last year of the selected
         Congress"""
-        end_year = None
-        if hasattr(self, '_years') and len(self._years) > 1:
-            end_year = self._years[1]
-        return end_year
+        return self._end_year
 
     @property
     def bioguide(self):
         """returns Bioguide data as a `BioguideCongressRecord`"""
-        bioguide = None
-        if hasattr(self, '_bg'):
-            bioguide = self._bg
-        return bioguide
+        return self._bg
 
     @property
     def govinfo(self):
@@ -394,13 +653,10 @@ class Congress:
 
     @bioguide.setter
     def bioguide(self, new_bioguide):
-        valid_bioguide = (new_bioguide.number is not None
-                          and new_bioguide.start_year is not None
-                          and new_bioguide.end_year is not None
-                          and new_bioguide.members is not None)
-
-        if valid_bioguide:
+        if None not in _REQUIRED_CONGRESS_FIELDS(new_bioguide):
             self._bg = new_bioguide
+            self._bg_index = None
+            self._members = None
         else:
             raise gpo.InvalidBioguideError()
 
@@ -416,17 +672,25 @@ class Congress:
     #     else:
     #         raise gpo.InvalidGovInfoError()
 
-    @property
-    def members(self):
-        """returns a `list` of unique `CongressMember` objects"""
-        member_list = list()
-
-        if self._bg:
+    def iter_members(self):
+        """yields the `CongressMember` objects of `members` one at a time,
+        without building the full list first"""
+        if self._members is not None:
+            yield from self._members
+        elif self._bg:
             for member_record in self._bg.members:
                 bioguide_id = member_record.bioguide_id
                 member = CongressMember(bioguide_id, load_immediately=False)
                 member.bioguide = member_record
-                member_list.append(member)
+                yield member
+
+    @property
+    def members(self):
+        """returns a `list` of unique `CongressMember` objects"""
+        if self._members is not None:
+            return list(self._members)
+
+        member_list = list(self.iter_members())
 
         # if self._gi and self._bg:
         #     for member_record in self._gi.members:
@@ -457,4 +721,13 @@ class Congress:
         #         member.govinfo = member_record
         #         member_list.append(member)
 
+        # the members are kept so that later reads skip rebuilding them,
+        # but each caller gets its own list
+        self._members = tuple(member_list)
         return member_list
+
+
+# the attributes carried over to a copy of a Congress; each copy gets its
+# own lock, and references to the original aren't copied
+_COPIED_CONGRESS_SLOTS = tuple(name for name in Congress.__slots__
+                               if name not in ('_lock', '__weakref__'))
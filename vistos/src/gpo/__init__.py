@@ -1,25 +1,32 @@
 """Module for interfacing with public datasets
 provided by the United States Government Publishing Office"""
-from vistos.src.gpo import bioguideretro as bioguide, govinfo
-
-from vistos.src.gpo.index import lookup_bioguide_ids
-
-from vistos.src.gpo.util \
-    import (convert_to_congress_number,
-            get_current_congress_number,
-            get_start_year,
-            get_end_year,
-            get_congress_years,
-            get_congress_numbers,
-            all_congress_numbers)
-from vistos.src.gpo.option \
-    import (Position, Party, State)
-
-from vistos.src.gpo.error \
-    import (InvalidBioguideError,
-            InvalidGovInfoError,
-            InvalidGovInfoBillsError,
-            BioguideConnectionError)
+import importlib as _importlib
+
+# Names exported by this module, paired with the submodules that define
+# them. Submodules (and their HTTP and XML dependencies) are only imported
+# once one of their names is used
+_SUBMODULES = {'bioguide': 'vistos.src.gpo.bioguideretro',
+               'govinfo': 'vistos.src.gpo.govinfo'}
+
+_ATTRIBUTES = {'lookup_bioguide_ids': 'vistos.src.gpo.index',
+               'enable_cache': 'vistos.src.gpo.cache',
+               'disable_cache': 'vistos.src.gpo.cache',
+               'clear_cache': 'vistos.src.gpo.cache',
+               'close_session': 'vistos.src.gpo.session',
+               'convert_to_congress_number': 'vistos.src.gpo.util',
+               'get_current_congress_number': 'vistos.src.gpo.util',
+               'get_start_year': 'vistos.src.gpo.util',
+               'get_end_year': 'vistos.src.gpo.util',
+               'get_congress_years': 'vistos.src.gpo.util',
+               'get_congress_numbers': 'vistos.src.gpo.util',
+               'all_congress_numbers': 'vistos.src.gpo.util',
+               'Position': 'vistos.src.gpo.option',
+               'Party': 'vistos.src.gpo.option',
+               'State': 'vistos.src.gpo.option',
+               'InvalidBioguideError': 'vistos.src.gpo.error',
+               'InvalidGovInfoError': 'vistos.src.gpo.error',
+               'InvalidGovInfoBillsError': 'vistos.src.gpo.error',
+               'BioguideConnectionError': 'vistos.src.gpo.error'}
 
 __all__ = ['bioguide',
            'govinfo',
@@ -34,7 +41,39 @@ __all__ = ['bioguide',
            'get_congress_numbers',
            'all_congress_numbers',
            'lookup_bioguide_ids',
+           'enable_cache',
+           'disable_cache',
+           'clear_cache',
+           'close_session',
            'InvalidBioguideError',
            'InvalidGovInfoError',
            'InvalidGovInfoBillsError',
            'BioguideConnectionError']
+
+
+def __getattr__(name):
+    if name in _SUBMODULES:
+        value = _importlib.import_module(_SUBMODULES[name])
+    elif name in _ATTRIBUTES:
+        value = getattr(_importlib.import_module(_ATTRIBUTES[name]), name)
+    elif not name.startswith('__'):
+        # fall back on the submodules themselves (`gpo.util`, `gpo.option`)
+        module_name = f'{__name__}.{name}'
+        try:
+            value = _importlib.import_module(module_name)
+        except ModuleNotFoundError as err:
+            if err.name != module_name:
+                raise
+            raise AttributeError(
+                f'module {__name__!r} has no attribute {name!r}') from None
+    else:
+        raise AttributeError(
+            f'module {__name__!r} has no attribute {name!r}')
+
+    # store the value so that later lookups skip this function
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
@@ -1,24 +1,64 @@
 """A module for querying Bioguide data provided by the US GPO"""
 
-import json as _json
-import time as _time
+import functools as _functools
 import re as _re
 import sys as _sys
-from typing import List, Optional, Callable
-from defusedxml import ElementTree as _XML
-from queue import PriorityQueue
-from threading import Thread
+import threading as _threading
+import time as _time
+from concurrent.futures import ThreadPoolExecutor as _ThreadPoolExecutor
+from operator import itemgetter as _itemgetter
+from typing import List, Optional, Callable, Tuple
+from lxml import etree as _XML
 
+import orjson as _orjson
 import requests as _requests
-from bs4 import BeautifulSoup as _BeautifulSoup
 
-from vistos.src.gpo import (error as _error,
+from vistos.src.gpo import (cache as _cache,
+                            error as _error,
                             index as _index,
+                            session as _session,
                             util as _util,
                             fields as _fields,
                             option as _option)
 
 
+# patterns for parsing the parts of a member's first names
+_SUFFIX_PATTERN = _re.compile(r',? (Jr\.?|Sr\.?|IV|I{1,3})')
+_NICKNAME_PATTERN = _re.compile(r' \(([\w\. ]+)\)')
+
+# positions left out of a member's merged terms
+_MERGE_SKIPPED_POSITIONS = frozenset(('vice president', 'president'))
+
+# workers for fetching member records, kept for the life of the process so
+# that repeated searches don't each start and tear down a pool of threads
+_EXECUTOR = _ThreadPoolExecutor(_util.NUMBER_OF_REQUEST_THREADS)
+
+# the clock used to age member records and verification tokens
+_clock = _time.monotonic
+
+# bumped when the cache is cleared, so that member records kept in memory
+# by `create_bioguide_member_func` are loaded again
+_member_records_generation = 0
+
+# lxml parsers can't be shared between threads, so each worker keeps its own
+_XML_PARSERS = _threading.local()
+
+# the verification token for searches, along with the cookies issued with
+# it, is fetched once and reused by later queries for up to
+# `VERIFICATION_TOKEN_LIFETIME` seconds
+VERIFICATION_TOKEN_LIFETIME = 15 * 60
+
+_shared_verification = None
+_shared_verification_lock = _threading.Lock()
+
+
+def _field_property(field: str, doc: str) -> property:
+    """Returns a read-only property for a field of a dict-based record"""
+    # itemgetter binds the field name once and does the lookup in C,
+    # rather than resolving _fields.<Class>.<NAME> on every access
+    return property(_itemgetter(field), doc=doc)
+
+
 class BioguideRetroQuery:
     """Object for sending HTTP POST requests to bioguideretro.congress.gov"""
 
@@ -35,27 +75,33 @@ class BioguideRetroQuery:
         self.state = state
         self.party = party
         self.year_or_congress = congress
-        self.verification_token = _get_verification_token()
+        # the search pages are tied to the cookies of the query that
+        # requested them, so each query keeps its own session
+        self.session = _session.create_session()
+        self.verification_token, self._fresh_token = \
+            _get_shared_verification_token(self.session)
 
     def send(self) -> _requests.Response:
         """Sends an HTTP POST request to bioguide.congress.gov,
         returning the resulting HTML text"""
-        attempts = 0
-        while True:
-            try:
-                url = _util.BIOGUIDERETRO_SEARCH_URL_STR
-                response = _requests.post(url, self.params)
-            except _requests.exceptions.ConnectionError as err:
-                if attempts < _util.MAX_REQUEST_ATTEMPTS:
-                    attempts += 1
-                    continue
-                raise _error.BioguideConnectionError() from err
-            break
-        return response
+        try:
+            url = _util.BIOGUIDERETRO_SEARCH_URL_STR
+            response = self.session.post(url, self.params)
+
+            if not response.ok and not self._fresh_token:
+                # a token shared from an earlier query may no longer be
+                # accepted, so fetch a new one and try again
+                self.refresh_verification_token()
+                response = self.session.post(url, self.params)
+
+            return response
+        except _requests.exceptions.ConnectionError as err:
+            raise _error.BioguideConnectionError() from err
 
     def refresh_verification_token(self) -> None:
         """Fetches a new verification token"""
-        self.verification_token = _get_verification_token()
+        self.verification_token, self._fresh_token = \
+            _get_shared_verification_token(self.session, refresh=True)
 
     @property
     def params(self) -> dict:
@@ -72,15 +118,15 @@ class BioguideRetroQuery:
 
 class BioguideTermRecord(dict):
     """A dict-like object for storing term details"""
+    __slots__ = ()
 
     def __init__(self, congress_number, party, position, state) -> None:
         super().__init__()
         self[_fields.Term.CONGRESS_NUMBER] = congress_number
 
-        self[_fields.Term.TERM_START] = \
-            _util.get_start_year(congress_number)
-        self[_fields.Term.TERM_END] = \
-            _util.get_end_year(congress_number)
+        start_year, end_year = _util.get_congress_years(congress_number)
+        self[_fields.Term.TERM_START] = start_year
+        self[_fields.Term.TERM_END] = end_year
 
         self[_fields.Term.POSITION] = position
         self[_fields.Term.STATE] = state
@@ -106,72 +152,75 @@ class BioguideTermRecord(dict):
 
     def to_json(self):
         """Returns the current term as a JSON string"""
-        return _json.dumps(self)
+        return _orjson.dumps(self).decode('utf-8')
 
-    @property
-    def congress_number(self) -> int:
-        """a Congressional term's number"""
-        return self[_fields.Term.CONGRESS_NUMBER]
+    congress_number = _field_property(
+        _fields.Term.CONGRESS_NUMBER,
+        """a Congressional term's number""")
 
-    @property
-    def start_year(self) -> int:
-        """the year that a Congressional term began"""
-        return self[_fields.Term.TERM_START]
+    start_year = _field_property(
+        _fields.Term.TERM_START,
+        """the year that a Congressional term began""")
 
-    @property
-    def end_year(self) -> int:
-        """the year that a Congressional term ended"""
-        return self[_fields.Term.TERM_END]
+    end_year = _field_property(
+        _fields.Term.TERM_END,
+        """the year that a Congressional term ended""")
 
-    @property
-    def position(self) -> str:
-        """the position a Congress member held during the current term"""
-        return self[_fields.Term.POSITION]
+    position = _field_property(
+        _fields.Term.POSITION,
+        """the position a Congress member held during the current term""")
 
-    @property
-    def is_house_speaker(self) -> bool:
+    is_house_speaker = _field_property(
+        _fields.Term.SPEAKER_OF_THE_HOUSE,
         """a boolean flag indicating if the current member
-        held the position of Speaker of the House during the term"""
-        return self[_fields.Term.SPEAKER_OF_THE_HOUSE]
+        held the position of Speaker of the House during the term""")
 
-    @property
-    def state(self) -> str:
+    state = _field_property(
+        _fields.Term.STATE,
         """the state for which a Congress member
-        served during the current term"""
-        return self[_fields.Term.STATE]
+        served during the current term""")
 
-    @property
-    def party(self) -> str:
+    party = _field_property(
+        _fields.Term.PARTY,
         """the party to which a Congress member
-        belonged during the current term"""
-        return self[_fields.Term.PARTY]
+        belonged during the current term""")
 
 
 class BioguideTermList(list):
     """A list-based class for handling multiple BioguideTermRecords"""
+    __slots__ = ()
 
     def __init__(self, term_list: List[BioguideTermRecord]):
-        super().__init__()
-        for term in term_list:
-            self.append(term)
+        super().__init__(term_list)
 
     def __str__(self):
         return self.to_json()
 
     def to_json(self) -> str:
         """Returns the current member list as a JSON string"""
-        return _json.dumps(self)
+        return _orjson.dumps(self).decode('utf-8')
 
 
 class BioguideMemberRecord(dict):
     """A class for handing bioguide member data"""
+    __slots__ = ()
 
     def __init__(self, xml_data) -> None:
         super().__init__()
         self[_fields.Member.ID] = xml_data.attrib['id']
         personal_info = xml_data.find('personal-info')
 
-        name = personal_info.find('name')
+        # sort the personal info into its terms and its other fields in one
+        # pass, rather than searching the children once per field
+        info = dict()
+        terms = []
+        for element in personal_info:
+            if element.tag == 'term':
+                terms.append(element)
+            elif element.tag not in info:
+                info[element.tag] = element
+
+        name = info.get('name')
         self[_fields.Member.LAST_NAME] = \
             _util.Text.fix_last_name_casing(name.find('lastname').text.strip())
 
@@ -181,29 +230,27 @@ class BioguideMemberRecord(dict):
         # parse suffixes like Jr, Sr, III etc from
         # the first name to enable easier concatenation
         # into a formatted whole name further downstream
-        suffix_pattern = r',? (Jr\.?|Sr\.?|IV|I{1,3})'
-        suffix_match = _re.search(suffix_pattern, first_name)
+        suffix_match = _SUFFIX_PATTERN.search(first_name)
         if suffix_match:
             self[_fields.Member.SUFFIX] = suffix_match.group(1)
-            first_name = _re.sub(suffix_pattern, '', first_name)
+            first_name = _SUFFIX_PATTERN.sub('', first_name)
         else:
             self[_fields.Member.SUFFIX] = None
 
-        nickname_pattern = r' \(([\w\. ]+)\)'
-        nickname_match = _re.search(nickname_pattern, first_name)
+        nickname_match = _NICKNAME_PATTERN.search(first_name)
         if nickname_match:
             self[_fields.Member.NICKNAME] = nickname_match.group(1)
-            first_name = _re.sub(nickname_pattern, '', first_name)
+            first_name = _NICKNAME_PATTERN.sub('', first_name)
         else:
             self[_fields.Member.NICKNAME] = None
 
         self[_fields.Member.FIRST_NAME] = first_name
 
-        birth_year = personal_info.find('birth-year').text
+        birth_year = info.get('birth-year').text
         self[_fields.Member.BIRTH_YEAR] = \
             birth_year.strip() if birth_year and birth_year.strip() else None
 
-        death_year = personal_info.find('death-year').text
+        death_year = info.get('death-year').text
         self[_fields.Member.DEATH_YEAR] = \
             death_year.strip() if death_year and death_year.strip() else None
 
@@ -215,20 +262,26 @@ class BioguideMemberRecord(dict):
             self[_fields.Member.BIOGRAPHY] = None
 
         term_records = []
-        for term in personal_info.findall('term'):
+        for term in terms:
+            term_info = _first_children(term)
             try:
-                congress_number = int(str(term.find('congress-number').text))
+                congress_number = \
+                    int(str(term_info.get('congress-number').text))
             except AttributeError:
                 continue
 
-            party = term.find('term-party').text
+            # terms that the merge would drop are never built
+            position = str(term_info.get('term-position').text).lower()
+            if position in _MERGE_SKIPPED_POSITIONS:
+                continue
+
+            party = term_info.get('term-party').text
             if party == 'NA' or (party and party.strip() == ''):
                 party = None
             else:
                 party = str(party).lower()
 
-            position = str(term.find('term-position').text).lower()
-            state = str(term.find('term-state').text).upper()
+            state = str(term_info.get('term-state').text).upper()
             term_records.append(BioguideTermRecord(congress_number, party,
                                                    position, state))
 
@@ -247,68 +300,59 @@ class BioguideMemberRecord(dict):
 
     def to_json(self) -> str:
         """Returns the current member as a JSON string"""
-        return _json.dumps(self)
+        return _orjson.dumps(self).decode('utf-8')
 
-    @property
-    def bioguide_id(self) -> str:
-        """a US Congress member's Bioguide ID"""
-        return self[_fields.Member.ID]
+    bioguide_id = _field_property(
+        _fields.Member.ID,
+        """a US Congress member's Bioguide ID""")
 
-    @property
-    def first_name(self) -> str:
-        """a US Congress member's first name"""
-        return self[_fields.Member.FIRST_NAME]
+    first_name = _field_property(
+        _fields.Member.FIRST_NAME,
+        """a US Congress member's first name""")
 
-    @property
-    def last_name(self) -> str:
-        """a US Congress member's surname"""
-        return self[_fields.Member.LAST_NAME]
+    last_name = _field_property(
+        _fields.Member.LAST_NAME,
+        """a US Congress member's surname""")
 
-    @property
-    def nickname(self) -> str:
-        """a US Congress member's prefered name"""
-        return self[_fields.Member.NICKNAME]
+    nickname = _field_property(
+        _fields.Member.NICKNAME,
+        """a US Congress member's prefered name""")
 
-    @property
-    def suffix(self) -> str:
-        """a US Congress member's name suffix"""
-        return self[_fields.Member.SUFFIX]
+    suffix = _field_property(
+        _fields.Member.SUFFIX,
+        """a US Congress member's name suffix""")
 
-    @property
-    def birth_year(self) -> str:
-        """a US Congress member's year of birth"""
-        return self[_fields.Member.BIRTH_YEAR]
+    birth_year = _field_property(
+        _fields.Member.BIRTH_YEAR,
+        """a US Congress member's year of birth""")
 
-    @property
-    def death_year(self) -> str:
-        """a US Congress member's year of death"""
-        return self[_fields.Member.DEATH_YEAR]
+    death_year = _field_property(
+        _fields.Member.DEATH_YEAR,
+        """a US Congress member's year of death""")
 
-    @property
-    def biography(self) -> str:
-        """A US Congress member's biography"""
-        return self[_fields.Member.BIOGRAPHY]
+    biography = _field_property(
+        _fields.Member.BIOGRAPHY,
+        """A US Congress member's biography""")
 
-    @property
-    def terms(self) -> BioguideTermList:
-        """a US Congress member's terms"""
-        return self[_fields.Member.TERMS]
+    terms = _field_property(
+        _fields.Member.TERMS,
+        """a US Congress member's terms""")
 
 
 class BioguideMemberRecords(dict):
     """a dict-based class for handling multiple members"""
+    __slots__ = ()
 
     def __init__(self, members_list: List[BioguideMemberRecord]):
-        super().__init__()
-        for member in members_list:
-            self[member.bioguide_id] = member
+        super().__init__((member.bioguide_id, member)
+                         for member in members_list)
 
     def __str__(self):
         return self.to_json()
 
     def to_json(self) -> str:
         """Returns the current collection of members as JSON"""
-        return _json.dumps(self)
+        return _orjson.dumps(self).decode('utf-8')
 
     def to_list(self) -> List[BioguideMemberRecord]:
         """Returns the current collection of members
@@ -318,18 +362,17 @@ class BioguideMemberRecords(dict):
 
 class BioguideMemberList(list):
     """A list-based class for handling multiple BioguideConressRecords"""
+    __slots__ = ()
 
     def __init__(self, member_list: List[BioguideMemberRecord]):
-        super().__init__()
-        for member in member_list:
-            self.append(member)
+        super().__init__(member_list)
 
     def __str__(self):
         return self.to_json()
 
     def to_json(self) -> str:
         """Returns the current member list as a JSON string"""
-        return _json.dumps(self)
+        return _orjson.dumps(self).decode('utf-8')
 
     def to_records(self) -> BioguideMemberRecords:
         """Returns the current member list as a CongressMemberRecords object"""
@@ -338,6 +381,7 @@ class BioguideMemberList(list):
 
 class BioguideCongressRecord(dict):
     """A class for grouping BioguideMemberList byy congress"""
+    __slots__ = ()
 
     def __init__(self, congress_number: int, members: BioguideMemberList):
         super().__init__()
@@ -370,27 +414,23 @@ class BioguideCongressRecord(dict):
 
     def to_json(self) -> str:
         """Returns the current congress as a JSON string"""
-        return _json.dumps(self)
+        return _orjson.dumps(self).decode('utf-8')
 
-    @property
-    def number(self) -> int:
-        """congress number"""
-        return self[_fields.Congress.NUMBER]
+    number = _field_property(
+        _fields.Congress.NUMBER,
+        """congress number""")
 
-    @property
-    def start_year(self) -> int:
-        """The year the given congress started"""
-        return self[_fields.Congress.START_YEAR]
+    start_year = _field_property(
+        _fields.Congress.START_YEAR,
+        """The year the given congress started""")
 
-    @property
-    def end_year(self) -> int:
-        """The year the given congress ended"""
-        return self[_fields.Congress.END_YEAR]
+    end_year = _field_property(
+        _fields.Congress.END_YEAR,
+        """The year the given congress ended""")
 
-    @property
-    def members(self) -> BioguideMemberList:
-        """A list of congress members belonging to the given congress"""
-        return self[_fields.Congress.MEMBERS]
+    members = _field_property(
+        _fields.Congress.MEMBERS,
+        """A list of congress members belonging to the given congress""")
 
 
 # Types Aliases
@@ -414,16 +454,48 @@ def create_bioguide_members_func(fname: str = None, lname: str = None,
     return load_members
 
 
+@_functools.lru_cache(maxsize=4096)
 def create_bioguide_member_func(bioguide_id: str) -> BioguideMemberFunc:
     """Returns a preseeded function for retreiving data
-     for a single congress member"""
+     for a single congress member (the member is only downloaded by the
+     first call; later calls return the same record until it expires or
+     the cache is cleared)"""
+    # the same function is handed out for repeated requests for one
+    # member, so its kept record is shared by everything loading them
+    loaded = None
 
     def load_member() -> BioguideMemberRecord:
-        return _query_member_by_id(bioguide_id)
+        nonlocal loaded
+        if loaded is not None and _is_member_record_current(*loaded[1:]):
+            return loaded[0]
+
+        record = _query_member_by_id(bioguide_id)
+        loaded = (record, _member_records_generation, _clock())
+        return record
 
     return load_member
 
 
+def _is_member_record_current(generation: int, loaded_at: float) -> bool:
+    """Returns True if a member record kept in memory can still be used"""
+    if generation != _member_records_generation:
+        return False
+
+    expire_after = _cache.get_expire_after()
+    return expire_after is None \
+        or _clock() - loaded_at <= expire_after
+
+
+def _forget_member_records():
+    """Makes every member record kept in memory load again on next use"""
+    global _member_records_generation
+    _member_records_generation += 1
+    create_bioguide_member_func.cache_clear()
+
+
+_cache.on_clear(_forget_member_records)
+
+
 def create_bioguide_func(number: int = 1) -> BioguideCongressFunc:
     """Returns a preseeded function for retrieving a single congress"""
     def load_bioguide() -> BioguideCongressRecord:
@@ -432,101 +504,132 @@ def create_bioguide_func(number: int = 1) -> BioguideCongressFunc:
     return load_bioguide
 
 
+def _first_children(element) -> dict:
+    """Returns the children of an XML element by tag, keeping the first
+    child of each tag (as `find()` would)"""
+    children = dict()
+    for child in element:
+        children.setdefault(child.tag, child)
+    return children
+
+
 def _merge_terms(term_records: BioguideTermList) -> BioguideTermList:
     """Returns unique congressional terms for a given member"""
     merged_terms = dict()
 
     for term in term_records:
-        if term.position in ('vice president', 'president'):
+        # read the compared fields once, straight from the record
+        position = term[_fields.Term.POSITION]
+        if position in _MERGE_SKIPPED_POSITIONS:
             continue
 
-        try:
-            match = merged_terms[term.congress_number]
-
-            # if a duplicate term exists, merge the details
-            if match.party != term.party:
-                match = term  # updates with most recent
-                # There's nothing in the bioguide dataset to
-                # indicate which party is the most recent,
-                # so for now, the order by which they are
-                # presented in the XML is assumed to be the
-                # order by which the member was affilated
-                # to each party (maybe invalidly)
-
-            if match.is_house_speaker:
-                # shed "speaker of the house" in
-                # favor of the actual position
-                # (really only representative)
-                match[_fields.Term.POSITION] = term.position
-            elif term.is_house_speaker:
-                # if current record is house speaker
-                # flag the existing record as house speaker
-                match[_fields.Term.SPEAKER_OF_THE_HOUSE] = True
-
-            merged_terms[term.congress_number] = match  # write changes
-        except KeyError:
-            merged_terms[term.congress_number] = term
+        congress_number = term[_fields.Term.CONGRESS_NUMBER]
+        match = merged_terms.get(congress_number)
+        if match is None:
+            merged_terms[congress_number] = term
+            continue
+
+        # if a duplicate term exists, merge the details
+        if match.party != term.party:
+            match = term  # updates with most recent
+            # There's nothing in the bioguide dataset to
+            # indicate which party is the most recent,
+            # so for now, the order by which they are
+            # presented in the XML is assumed to be the
+            # order by which the member was affilated
+            # to each party (maybe invalidly)
+
+        if match.is_house_speaker:
+            # shed "speaker of the house" in
+            # favor of the actual position
+            # (really only representative)
+            match[_fields.Term.POSITION] = position
+        elif term.is_house_speaker:
+            # if current record is house speaker
+            # flag the existing record as house speaker
+            match[_fields.Term.SPEAKER_OF_THE_HOUSE] = True
+
+        merged_terms[congress_number] = match  # write changes
 
     return BioguideTermList(merged_terms.values())
 
 
 def _query_member_by_id(bioguide_id: str) -> BioguideMemberRecord:
     """Get a member record corresponding to the given bioguide ID"""
-    xml_relative_url = bioguide_id[0] + '/' + bioguide_id + '.xml'
-    request_url = _util.BIOGUIDERETRO_MEMBER_XML_URL + xml_relative_url
+    member_xml = _cache.get_bytes(_cache.BIOGUIDE, bioguide_id)
+    is_cached = member_xml is not None
 
-    member_record = None
-    attempts = 0
-    while True:
-        try:
-            response = _requests.get(request_url)
-        except _requests.exceptions.ConnectionError as err:
-            if attempts < _util.MAX_REQUEST_ATTEMPTS:
-                attempts += 1
-                _time.sleep(2 * attempts)
-                continue
-            raise _error.BioguideConnectionError() from err
+    if not is_cached:
+        member_xml = _get_member_xml(bioguide_id)
 
-        try:
-            xml_root = _XML.fromstring(response.text)
-            member_record = BioguideMemberRecord(xml_root)
-            break
-        except _XML.ParseError:
-            xml_root = _XML.fromstring(_util.Text.clean_xml(response.text))
-            member_record = BioguideMemberRecord(xml_root)
+    xml_root = _parse_member_xml(member_xml)
+
+    member_record = BioguideMemberRecord(xml_root)
 
-        break  # just in case
+    if not is_cached:
+        _cache.put_bytes(_cache.BIOGUIDE, bioguide_id, member_xml)
 
     return member_record
 
 
-def _query_members_by_id(bioguide_ids: list) -> BioguideMemberList:
-    """Gets a BioguideMemberList object corresponding
-    to the given list of bioguide IDs"""
-    member_records = list()
+def _parse_member_xml(member_xml: bytes):
+    """Parses the XML document of a member"""
+    # the raw bytes are parsed as-is, leaving the decoding to libxml2.
+    # Records with stray invalid characters are cleaned and parsed again
+    try:
+        return _XML.fromstring(member_xml, _get_xml_parser())
+    except _XML.XMLSyntaxError:
+        clean_xml = _util.Text.clean_xml(member_xml.decode('utf-8', 'ignore'))
+        return _XML.fromstring(clean_xml.encode('utf-8'), _get_xml_parser())
+
+
+def _get_xml_parser():
+    """Returns the member XML parser of the current thread"""
+    parser = getattr(_XML_PARSERS, 'parser', None)
+    if parser is None:
+        # never expand entities or fetch external resources. The
+        # indentation between elements is never read, so it isn't kept
+        parser = _XML.XMLParser(resolve_entities=False, no_network=True,
+                                remove_blank_text=True)
+        _XML_PARSERS.parser = parser
+    return parser
+
+
+def _get_member_xml(bioguide_id: str) -> bytes:
+    """Downloads the XML document for the given bioguide ID"""
+    request_url = \
+        _util.BIOGUIDERETRO_MEMBER_XML_URL_FMT.format(bioguide_id[0],
+                                                      bioguide_id)
+
+    # failed connections are retried by the session
+    try:
+        response = _session.get(request_url)
+    except _requests.exceptions.ConnectionError as err:
+        raise _error.BioguideConnectionError() from err
 
-    def _get_members_concurrently():
-        while True:
-            bioguide_id = q.get()
-            member_record = _query_member_by_id(bioguide_id)
-            member_records.append(member_record)
-            q.task_done()
+    return response.content
 
-    q = PriorityQueue(_util.NUMBER_OF_THREADS * 2)
-    for _ in range(_util.NUMBER_OF_THREADS):
-        t = Thread(target=_get_members_concurrently)
-        t.daemon = True
-        t.start()
 
+def _query_members_by_id(bioguide_ids: list) -> BioguideMemberList:
+    """Gets a BioguideMemberList object corresponding
+    to the given list of bioguide IDs"""
+    # download each member once, even if they're listed more than once, and
+    # go through the per-member loaders so that members already downloaded
+    # for another Congress or search are reused
+    unique_ids = list(dict.fromkeys(bioguide_ids))
     try:
-        for bioguide_id in bioguide_ids:
-            q.put(bioguide_id)
-
-        q.join()
+        unique_records = \
+            dict(zip(unique_ids, _EXECUTOR.map(_load_member, unique_ids)))
     except KeyboardInterrupt:
         _sys.exit(1)
 
-    return BioguideMemberList(member_records)
+    return BioguideMemberList([unique_records[bioguide_id]
+                               for bioguide_id in bioguide_ids])
+
+
+def _load_member(bioguide_id: str) -> BioguideMemberRecord:
+    """Loads a member record through the shared loader for that member"""
+    return create_bioguide_member_func(bioguide_id)()
 
 
 def _query_members(fname: str = None, lname: str = None,
@@ -548,7 +651,7 @@ def _query_members(fname: str = None, lname: str = None,
 
     query = BioguideRetroQuery(lname, fname, pos, state, party, congress)
     bioguide_ids = _scrape_bioguide_ids(query)
-    records = _get_member_records(bioguide_ids)
+    records = _query_members_by_id(bioguide_ids)
     return records
 
 
@@ -565,23 +668,77 @@ def _query_bioguide_by_number(congress_number: int = 1, scrape: bool = False) \
     return record
 
 
-def _get_verification_token() -> str:
-    """Fetches a session key for bioguideretro.congress.gov"""
-    root_page = _requests.get(_util.BIOGUIDERETRO_ROOT_URL_STR)
-    soup = _BeautifulSoup(root_page.text, features='html.parser')
-    verification_token_input = \
-        soup.select_one('input[name="__RequestVerificationToken"]')
-    return verification_token_input['value']
+def _parse_html(text: str):
+    """Parses HTML text into an lxml element tree"""
+    # lxml.html is only needed for scraping search results, so defer
+    # importing it until a scrape actually happens
+    from lxml import html as _html
+    return _html.fromstring(text)
+
+
+def _has_class(class_name: str) -> str:
+    """Returns an XPath test matching elements with the given class"""
+    return ("contains(concat(' ', normalize-space(@class), ' '), "
+            f"' {class_name} ')")
+
+
+# XPath equivalents of the CSS selectors for each scraped element, compiled
+# once. Where only an attribute is needed, it's selected directly
+_VERIFICATION_TOKEN_XPATH = \
+    _XML.XPath('//input[@name="__RequestVerificationToken"]/@value')
+_MEMBER_HREF_XPATH = \
+    _XML.XPath(f'//div[{_has_class("row")}]/div/a[{_has_class("red")}]/@href')
+_PAGE_LINK_XPATH = _XML.XPath(f'//ul[{_has_class("pagination")}]'
+                              f'/li[{_has_class("page-item")}]'
+                              f'/a[{_has_class("page-link")}]')
+_FINAL_PAGE_HREF_XPATH = _XML.XPath(f'//ul[{_has_class("pagination")}]'
+                                    f'/li[{_has_class("page-item")}]'
+                                    f'[{_has_class("PagedList-skipToLast")}]'
+                                    f'/a[{_has_class("page-link")}]/@href')
+
+# patterns for finding member links without parsing a page
+_ANCHOR_TAG_PATTERN = _re.compile(r'<a\s[^>]*>', _re.IGNORECASE)
+_CLASS_ATTRIBUTE_PATTERN = _re.compile(r'\sclass="([^"]*)"')
+_HREF_ATTRIBUTE_PATTERN = _re.compile(r'\shref="([^"]*)"')
+
+
+def _get_shared_verification_token(session: _requests.Session,
+                                   refresh: bool = False) -> Tuple[str, bool]:
+    """Returns the verification token shared by all queries, and whether it
+    was just fetched. The cookies issued with the token are copied into the
+    given session. A token is only fetched if there isn't one yet, if the
+    current one has expired, or if `refresh` is True"""
+    global _shared_verification
+
+    with _shared_verification_lock:
+        now = _clock()
+        if refresh or _shared_verification is None \
+                or now - _shared_verification[2] > VERIFICATION_TOKEN_LIFETIME:
+            # the token is fetched on a session of its own, so that only
+            # the cookies issued with it are shared, and never those left
+            # by the searches of the given session
+            token_session = _session.create_session()
+            try:
+                token = _get_verification_token(token_session)
+                cookies = token_session.cookies.copy()
+            finally:
+                token_session.close()
+
+            _shared_verification = (token, cookies, now)
+            fresh = True
+        else:
+            token, cookies, _ = _shared_verification
+            fresh = False
 
+        session.cookies.update(cookies)
+        return token, fresh
 
-def _get_member_records(bioguide_ids: List[str]) -> BioguideMemberList:
-    """Stores data from a Bioguide member query as a BioguideMemberList"""
-    member_records = list()
-    for bioguide_id in bioguide_ids:
-        member_record = _query_member_by_id(bioguide_id)
-        member_records.append(member_record)
 
-    return BioguideMemberList(member_records)
+def _get_verification_token(session: _requests.Session) -> str:
+    """Fetches a session key for bioguideretro.congress.gov"""
+    root_page = session.get(_util.BIOGUIDERETRO_ROOT_URL_STR)
+    tree = _parse_html(root_page.text)
+    return str(_VERIFICATION_TOKEN_XPATH(tree)[0])
 
 
 def _scrape_congress_bioguide_ids(congress: int = 1) -> List[str]:
@@ -598,7 +755,7 @@ def _scrape_congress_bioguide_ids(congress: int = 1) -> List[str]:
 
         position = 'Delegate'
         query = BioguideRetroQuery(congress=congress, position=position)
-        bioguide_ids = bioguide_ids + _scrape_bioguide_ids(query)
+        bioguide_ids.extend(_scrape_bioguide_ids(query))
 
     elif congress is None:
         congress = _util.get_current_congress_number()
@@ -613,71 +770,108 @@ def _scrape_congress_bioguide_ids(congress: int = 1) -> List[str]:
 
 
 def _scrape_bioguide_ids(query: BioguideRetroQuery) -> List[str]:
+    # the query's session keeps the cookies that tie the result pages to
+    # this search
     response = query.send()
-    cookie_jar = response.cookies
 
     # use the pagination information in the response
     # to determine how many more pages of information are available
-    final_page_num = _get_final_page_number(response.text)
+    # (the first page is parsed once, for both this and its IDs)
+    first_page = _parse_html(response.text)
+    final_page_num = _get_final_page_number(first_page)
 
     # then scrape the bioguide ids from the first page,
-    # and loop over the remaining pages
-    page_num = 1
-    bioguide_ids = list()
-    while page_num <= final_page_num:
-        soup = _BeautifulSoup(response.text, features='html.parser')
-        member_links = soup.select('div.row > div > a.red')
-        member_urls = [str(link['href']) for link in member_links]
-
-        # Parse Bioguide IDs from query string of member urls
-        bioguide_ids = bioguide_ids + list(str(url.split('?')[1].split('=')[1])
-                                           for url in member_urls)
-
-        if page_num == final_page_num:
-            break
-
-        page_num += 1
-        page_request_url = _util.BIOGUIDERETRO_SEARCH_URL_STR + \
-            '?page=' + str(page_num)
-
-        attempts = 0
-        while True:
-            try:
-                response = _requests.get(page_request_url, cookies=cookie_jar)
-            except _requests.exceptions.ConnectionError as err:
-                if attempts < _util.MAX_REQUEST_ATTEMPTS:
-                    # refresh session and re-attempt
-                    query.refresh_verification_token()
-                    cookie_jar = (query.send()).cookies
-                    attempts += 1
-                    continue
-                raise _error.BioguideConnectionError() from err
-            break
+    # and request the remaining pages all at once
+    bioguide_ids = _scrape_page_bioguide_ids(first_page)
+
+    # every page shares a layout, so if matching the member links in the
+    # raw HTML finds the same IDs as the parsed first page, the remaining
+    # pages are matched without building a tree for each
+    use_match = _match_page_bioguide_ids(response.text) == bioguide_ids
+
+    def scrape_page(page_num: int) -> List[str]:
+        page_response = _get_search_page(query, page_num)
+        if use_match:
+            return _match_page_bioguide_ids(page_response.text)
+        return _scrape_page_bioguide_ids(_parse_html(page_response.text))
+
+    # map() yields in page order, so the IDs keep the order of the results
+    for page_bioguide_ids in _EXECUTOR.map(scrape_page,
+                                           range(2, final_page_num + 1)):
+        bioguide_ids.extend(page_bioguide_ids)
 
     return bioguide_ids
 
 
-def _get_final_page_number(response_text: str) -> int:
+def _scrape_page_bioguide_ids(tree) -> List[str]:
+    """Parses the Bioguide IDs from a page of search results"""
+    # Parse Bioguide IDs from query string of member urls
+    return [_get_query_value(url) for url in _MEMBER_HREF_XPATH(tree)]
+
+
+def _match_page_bioguide_ids(page_text: str) -> List[str]:
+    """Finds the Bioguide IDs in a page of search results by matching the
+    member links in the raw HTML"""
+    member_urls = []
+    for tag in _ANCHOR_TAG_PATTERN.findall(page_text):
+        class_match = _CLASS_ATTRIBUTE_PATTERN.search(tag)
+        if class_match is None or 'red' not in class_match.group(1).split():
+            continue
+
+        href_match = _HREF_ATTRIBUTE_PATTERN.search(tag)
+        if href_match is not None:
+            member_urls.append(href_match.group(1))
+
+    return [_get_query_value(url) for url in member_urls]
+
+
+def _get_query_value(url: str) -> str:
+    """Returns the value of the first parameter in the query string of
+    a URL"""
+    return str(url.split('?', 2)[1].split('=', 2)[1])
+
+
+def _get_search_page(query: BioguideRetroQuery,
+                     page_num: int) -> _requests.Response:
+    """Requests a page of the results of a query that has been sent"""
+    page_request_url = \
+        _util.BIOGUIDERETRO_SEARCH_PAGE_URL_FMT.format(page_num)
+
+    attempts = 0
+    while True:
+        try:
+            return query.session.get(page_request_url)
+        except _requests.exceptions.ConnectionError as err:
+            if attempts < _util.MAX_REQUEST_ATTEMPTS:
+                # refresh session and re-attempt
+                query.refresh_verification_token()
+                query.send()
+                attempts += 1
+                continue
+            raise _error.BioguideConnectionError() from err
+
+
+def _get_final_page_number(tree) -> int:
     """Retrieves the total number of pages required to receive the full
     queried dataset"""
-    soup = _BeautifulSoup(response_text, features='html.parser')
-    final_page_ref = \
-        'ul.pagination > li.page-item.PagedList-skipToLast > a.page-link'
-    final_page_link = soup.select_one(final_page_ref)
+    final_page_hrefs = _FINAL_PAGE_HREF_XPATH(tree)
+    final_page_href = final_page_hrefs[0] if final_page_hrefs else None
 
-    if not final_page_link:
-        page_ref = 'ul.pagination > li.page-item > a.page-link'
-        page_links = soup.select(page_ref)
+    if final_page_href is None:
+        page_links = _PAGE_LINK_XPATH(tree)
 
         if len(page_links) > 0:
             final_page_link = page_links[-1]
 
-            if final_page_link.text == '>' or final_page_link.text == '&gt;':
+            final_page_text = final_page_link.text_content()
+            if final_page_text == '>' or final_page_text == '&gt;':
                 final_page_link = page_links[-2]
 
-    if final_page_link:
-        final_page_number = str(final_page_link['href'])\
-            .split('?')[1].split('=')[1]  # parse from query string
+            final_page_href = str(final_page_link.get('href'))
+
+    if final_page_href is not None:
+        # parse from query string
+        final_page_number = _get_query_value(final_page_href)
     else:
         # default to one for single-page results
         final_page_number = 1
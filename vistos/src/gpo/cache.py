@@ -0,0 +1,137 @@
+"""A module for caching GPO responses on disk between sessions
+
+Caching is disabled until `enable_cache()` is called. Once enabled, member
+records downloaded from the Bioguide and the Congressional Directory entries
+downloaded from GovInfo are saved as text and reused in place of new requests
+"""
+import hashlib as _hashlib
+import os as _os
+import shutil as _shutil
+import tempfile as _tempfile
+import time as _time
+from typing import Callable, Optional
+
+DEFAULT_CACHE_DIR = \
+    _os.path.join(_os.path.expanduser('~'), '.cache', 'vistos')
+
+# namespaces within the cache directory
+BIOGUIDE = 'bioguide'
+GOVINFO = 'govinfo'
+
+_cache_dir = None
+_expire_after = None
+
+# functions called by `clear_cache()`, for forgetting records kept in memory
+_clear_callbacks = []
+
+
+def enable_cache(cache_dir: str = None, expire_after: float = None):
+    """Saves downloaded records to the given directory (by default,
+    `DEFAULT_CACHE_DIR`) and reuses them for later requests. Records older
+    than `expire_after` seconds are downloaded again; if no expiration is
+    given, cached records are always reused"""
+    global _cache_dir, _expire_after
+
+    if cache_dir is None:
+        cache_dir = DEFAULT_CACHE_DIR
+
+    _os.makedirs(cache_dir, exist_ok=True)
+    _cache_dir = cache_dir
+    _expire_after = expire_after
+
+
+def disable_cache():
+    """Stops reading from and saving to the cache. Cached records are kept on
+    disk until `clear_cache()` is called"""
+    global _cache_dir, _expire_after
+    _cache_dir = None
+    _expire_after = None
+
+
+def cache_enabled() -> bool:
+    """Returns True if downloaded records are being cached"""
+    return _cache_dir is not None
+
+
+def clear_cache(cache_dir: str = None):
+    """Deletes every cached record from the given directory (by default, the
+    active cache directory or `DEFAULT_CACHE_DIR`), and forgets any records
+    kept in memory"""
+    if cache_dir is None:
+        cache_dir = _cache_dir if _cache_dir is not None else DEFAULT_CACHE_DIR
+
+    for namespace in (BIOGUIDE, GOVINFO):
+        _shutil.rmtree(_os.path.join(cache_dir, namespace),
+                       ignore_errors=True)
+
+    for callback in _clear_callbacks:
+        callback()
+
+
+def on_clear(callback: Callable[[], None]):
+    """Registers a function to be called whenever the cache is cleared"""
+    _clear_callbacks.append(callback)
+
+
+def get_expire_after() -> Optional[float]:
+    """Returns the number of seconds after which cached records are
+    downloaded again, or `None` if they never expire"""
+    return _expire_after
+
+
+def get_text(namespace: str, key: str) -> Optional[str]:
+    """Returns the cached text for the given key, or `None` if caching is
+    disabled or the key is missing or expired"""
+    data = get_bytes(namespace, key)
+    return data.decode('utf-8') if data is not None else None
+
+
+def put_text(namespace: str, key: str, text: str):
+    """Saves text to the cache under the given key, if caching is enabled"""
+    if text is not None:
+        put_bytes(namespace, key, text.encode('utf-8'))
+
+
+def get_bytes(namespace: str, key: str) -> Optional[bytes]:
+    """Returns the cached bytes for the given key, or `None` if caching is
+    disabled or the key is missing or expired"""
+    if _cache_dir is None:
+        return None
+
+    path = _entry_path(namespace, key)
+    try:
+        if _expire_after is not None:
+            if _time.time() - _os.path.getmtime(path) > _expire_after:
+                return None
+
+        with open(path, 'rb') as cache_file:
+            return cache_file.read()
+    except OSError:
+        return None
+
+
+def put_bytes(namespace: str, key: str, data: bytes):
+    """Saves bytes to the cache under the given key, if caching is enabled"""
+    if _cache_dir is None or data is None:
+        return
+
+    path = _entry_path(namespace, key)
+    directory = _os.path.dirname(path)
+    _os.makedirs(directory, exist_ok=True)
+
+    # write to a temporary file and swap it in, so that concurrent readers
+    # never see a partially written record
+    file_descriptor, temp_path = _tempfile.mkstemp(dir=directory)
+    try:
+        with _os.fdopen(file_descriptor, 'wb') as temp_file:
+            temp_file.write(data)
+        _os.replace(temp_path, path)
+    except OSError:
+        if _os.path.exists(temp_path):
+            _os.remove(temp_path)
+
+
+def _entry_path(namespace: str, key: str) -> str:
+    """Returns the file path of a cache entry"""
+    file_name = _hashlib.sha1(key.encode('utf-8')).hexdigest()
+    return _os.path.join(_cache_dir, namespace, file_name)
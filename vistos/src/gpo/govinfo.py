@@ -1,22 +1,36 @@
 """A module for querying Gov Info data provided by the US GPO"""
-import json as _json
 import math as _math
 import time as _time
 import re as _re
 import datetime as _dt
 import calendar as _cal
 import sys as _sys
-from typing import Any, Optional, List, Callable, Dict
-from threading import Thread
-from queue import Queue
+from concurrent.futures import ThreadPoolExecutor as _ThreadPoolExecutor
+from urllib.parse import urlencode as _urlencode
+from typing import Any, Optional, List, Callable, Dict, Tuple
 
+import orjson as _orjson
 import requests as _requests
 
 from vistos.src.gpo import (util as _util, fields as _fields,
-                            error as _error, index as _index)
+                            error as _error, index as _index,
+                            cache as _cache, session as _session)
 from vistos.src.gpo.bioguideretro import BioguideMemberRecord
 
 
+# CDIR granule summaries describing individual members of Congress
+_MEMBER_SUBGRANULE_CLASSES = frozenset(('SENATOR', 'REPRESENTATIVE',
+                                        'DELEGATE', 'RESIDENTCOMMISSIONER'))
+
+# the collections found to have the data of a Congress, by collection,
+# Congress number and API key
+_FOUND_COLLECTIONS = set()
+
+# workers for downloading listings and summaries, kept for the life of the
+# process. Tasks never wait on other tasks, so the pool can't deadlock
+_EXECUTOR = _ThreadPoolExecutor(_util.NUMBER_OF_REQUEST_THREADS)
+
+
 class GovInfoBillRecord(dict):
     """A dict-like object for handling Congressional bill
     data returned from the GovInfo API"""
@@ -25,10 +39,9 @@ class GovInfoBillRecord(dict):
         super().__init__()
         self._download_text = None
 
-        try:
-            bill_version = bill_govinfo['billVersion']
-        except KeyError:
-            bill_version = bill_govinfo.get('billVersionExtended')
+        bill_version = \
+            bill_govinfo.get('billVersion',
+                             bill_govinfo.get('billVersionExtended'))
 
         if not bill_version:
             self[_fields.Bill.BILL_ID] = (bill_govinfo['congress'] + '-' +
@@ -43,11 +56,9 @@ class GovInfoBillRecord(dict):
                                           bill_version)
 
         self[_fields.Bill.TITLE] = bill_govinfo['title']
-        try:
-            self[_fields.Bill.SHORT_TITLE] = \
-                bill_govinfo['shortTitle'][0]['title']
-        except (KeyError, IndexError):
-            self[_fields.Bill.SHORT_TITLE] = None
+        short_titles = bill_govinfo.get('shortTitle')
+        self[_fields.Bill.SHORT_TITLE] = \
+            short_titles[0].get('title') if short_titles else None
 
         self[_fields.Bill.CONGRESS] = bill_govinfo['congress']
 
@@ -64,30 +75,17 @@ class GovInfoBillRecord(dict):
             bool(bill_govinfo['isAppropriation'])
         self[_fields.Bill.IS_PRIVATE] = bool(bill_govinfo['isPrivate'])
 
-        try:
-            self[_fields.Bill.GOVERNMENT_AUTHOR] = \
-                bill_govinfo['governmentAuthor2']
-        except KeyError:
-            self[_fields.Bill.GOVERNMENT_AUTHOR] = None
-
-        try:
-            self[_fields.Bill.COMMITTEES] = bill_govinfo['committees']
-        except KeyError:
-            self[_fields.Bill.COMMITTEES] = None
-
-        try:
-            self[_fields.Bill.MEMBERS] = bill_govinfo['members']
-        except KeyError:
-            self[_fields.Bill.MEMBERS] = None
+        self[_fields.Bill.GOVERNMENT_AUTHOR] = \
+            bill_govinfo.get('governmentAuthor2')
+        self[_fields.Bill.COMMITTEES] = bill_govinfo.get('committees')
+        self[_fields.Bill.MEMBERS] = bill_govinfo.get('members')
 
         self[_fields.Bill.TEXT] = None
 
-        try:
-            text_url = bill_govinfo['download']['txtLink']
+        text_url = bill_govinfo.get('download', {}).get('txtLink')
+        if text_url is not None:
             self._download_text = \
                 _create_download_bill_text_func(text_url, api_key)
-        except (KeyError, ValueError):
-            self._download_text = None
 
     @property
     def bill_id(self) -> str:
@@ -161,6 +159,7 @@ class GovInfoBillRecord(dict):
 class GovInfoCongressRecord(dict):
     """A dict-like object for handling Congressional
     directory data returned from the GovInfo API"""
+    __slots__ = ()
 
     def __init__(self, number: int, start_year: int,
                  end_year: int, congress_govinfo: List[dict]):
@@ -199,6 +198,8 @@ GovInfoMemberRecord = Dict[str, Any]
 GovInfoMemberRecordFunc = \
     Callable[[BioguideMemberRecord], Optional[GovInfoMemberRecord]]
 GovInfoMemberList = List[GovInfoMemberRecord]
+GovInfoMemberListFunc = \
+    Callable[[List[BioguideMemberRecord]], List[Optional[GovInfoMemberRecord]]]
 
 GovInfoBillList = List[GovInfoBillRecord]
 GovInfoBillListFunc = Callable[[], GovInfoBillList]
@@ -224,6 +225,16 @@ def create_member_cdir_func(api_key: str) -> GovInfoMemberRecordFunc:
     return member_cdir_func
 
 
+def create_members_cdir_func(api_key: str) -> GovInfoMemberListFunc:
+    """Returns a preseeded function for loading the CDIR
+    member data of several members at once"""
+    def members_cdir_func(bioguide_members: List[BioguideMemberRecord]) \
+            -> List[Optional[GovInfoMemberRecord]]:
+        return _get_cdir_for_members(api_key, bioguide_members)
+
+    return members_cdir_func
+
+
 def create_bills_func(api_key: str, congress: int) -> GovInfoBillListFunc:
     """Returns a preseeded function for loading bills data
     based on a given Congress number"""
@@ -234,19 +245,38 @@ def create_bills_func(api_key: str, congress: int) -> GovInfoBillListFunc:
 
 
 def check_for_govinfo(congress: int, api_key: str):
-    """Check if a given Congress has GovInfo CDIR data"""
-    return _cdir_data_exists(api_key, congress)
+    """Check if a given Congress has GovInfo CDIR data
+    (data that's found is remembered for the lifetime of the process)"""
+    return _check_for_collection('CDIR', _cdir_data_exists, congress, api_key)
 
 
 def check_for_govinfo_bills(congress: int, api_key: str):
-    """Check if a given Congress has GovInfo BILLS data"""
-    return _bills_data_exists(api_key, congress)
+    """Check if a given Congress has GovInfo BILLS data
+    (data that's found is remembered for the lifetime of the process)"""
+    return _check_for_collection('BILLS', _bills_data_exists,
+                                 congress, api_key)
+
+
+def _check_for_collection(collection: str,
+                          data_exists: Callable[[str, int], bool],
+                          congress: int, api_key: str) -> bool:
+    """Checks for the data of a Congress in a collection. Only data that's
+    found is remembered, since the data of a Congress (like the current one)
+    may be published after it's first checked"""
+    key = (collection, congress, api_key)
+    if key in _FOUND_COLLECTIONS:
+        return True
+
+    exists = data_exists(api_key, congress)
+    if exists:
+        _FOUND_COLLECTIONS.add(key)
+    return exists
 
 
 def _create_download_bill_text_func(text_url: str, api_key: str):
     """Create callable for downloading bill text"""
     def download_bill_text():
-        return _get_text_from(f'{text_url}?api_key={api_key}')
+        return _get_text_from(text_url + _query_string(api_key=api_key))
     return download_bill_text
 
 
@@ -258,7 +288,7 @@ def _cdir_data_exists(api_key: str, congress: int) -> bool:
                              page_size=1,
                              congress=str(congress))
     collection_text = _get_text_from(endpoint)
-    collection = _json.loads(collection_text)
+    collection = _orjson.loads(collection_text)
 
     try:
         total_package_count = int(collection['count'])
@@ -276,7 +306,7 @@ def _bills_data_exists(api_key: str, congress: int) -> bool:
                              page_size=1,
                              congress=str(congress))
     collection_text = _get_text_from(endpoint)
-    collection = _json.loads(collection_text)
+    collection = _orjson.loads(collection_text)
 
     try:
         total_package_count = int(collection['count'])
@@ -289,6 +319,55 @@ def _bills_data_exists(api_key: str, congress: int) -> bool:
 def _get_cdir_for_member(api_key: str, bioguide_member: BioguideMemberRecord) \
         -> Optional[GovInfoMemberRecord]:
     """Returns the biography data for the given BioguideMemberRecord"""
+    last_term = _last_cdir_term(bioguide_member)
+    if last_term is None:
+        return None
+
+    latest_cdir = _latest_cdir_granules(api_key, last_term.congress_number)
+    if latest_cdir is None:
+        return None
+
+    package_id, granules = latest_cdir
+    return _find_member_granule(api_key, package_id, granules,
+                                last_term, bioguide_member.bioguide_id)
+
+
+def _get_cdir_for_members(api_key: str,
+                          bioguide_members: List[BioguideMemberRecord]) \
+        -> List[Optional[GovInfoMemberRecord]]:
+    """Returns the biography data for each of the given
+    BioguideMemberRecords, in the same order"""
+    last_terms = [_last_cdir_term(member) for member in bioguide_members]
+
+    # members whose last terms share a congress share a directory,
+    # so list each directory's granules once rather than once per member
+    congresses = {term.congress_number for term in last_terms
+                  if term is not None}
+    latest_cdirs = {congress: _latest_cdir_granules(api_key, congress)
+                    for congress in congresses}
+
+    def find_member_granule(bioguide_member, last_term):
+        if last_term is None:
+            return None
+
+        latest_cdir = latest_cdirs[last_term.congress_number]
+        if latest_cdir is None:
+            return None
+
+        package_id, granules = latest_cdir
+        return _find_member_granule(api_key, package_id, granules,
+                                    last_term, bioguide_member.bioguide_id)
+
+    try:
+        return list(_EXECUTOR.map(find_member_granule,
+                                  bioguide_members, last_terms))
+    except KeyboardInterrupt:
+        _sys.exit(1)
+
+
+def _last_cdir_term(bioguide_member: BioguideMemberRecord):
+    """Returns the last term of the given member that can be expected to
+    appear in a published directory, or None if there isn't one"""
 
     # if a member dies in office, they will not be in
     # the most recent CDIR for that term
@@ -314,49 +393,60 @@ def _get_cdir_for_member(api_key: str, bioguide_member: BioguideMemberRecord) \
 
     current_congress = _util.get_current_congress_number()
     # govinfo doesn't have the CDIR of the current congress, so exclude it
-    last_term = max(terms, key=lambda t: int(t.congress_number)
-                    if t.congress_number != current_congress else -1)
+    return max(terms, key=lambda t: int(t.congress_number)
+               if t.congress_number != current_congress else -1)
 
-    if not _cdir_data_exists(api_key, last_term.congress_number):
+
+def _latest_cdir_granules(api_key: str, congress: int) \
+        -> Optional[Tuple[str, List[dict]]]:
+    """Returns the package ID and granules of the most recent directory
+    published for the given congress, or None if there isn't one"""
+    if not _cdir_data_exists(api_key, congress):
         # if the last term doesn't have data, then none of the preceding
         # terms can be expected to have data either, so exit returning None
         return None
 
-    packages = \
-        _packages_by_congress(api_key, last_term.congress_number)
+    packages = _packages_by_congress(api_key, congress)
     package_id = \
         (max(packages, key=lambda package: package['dateIssued']))['packageId']
 
+    return package_id, _granules(api_key, package_id)
+
+
+def _find_member_granule(api_key: str, package_id: str, granules: List[dict],
+                         last_term, target_bioguide_id: str) \
+        -> Optional[GovInfoMemberRecord]:
+    """Searches a directory's granules for the summary of the given member"""
     state_key = last_term.state
     chamber_key = 'S' if last_term.position == 'senator' else 'H'
 
-    target_bioguide_id = bioguide_member.bioguide_id
     target_granule_id_pattern = f'^{package_id}-'
     target_granule_id_pattern += (state_key + '-' + chamber_key)
     target_granule_id_pattern += r'(-\d+)?$'
 
-    granules = _granules(api_key, package_id)
-    matching_granule = None
-    while len(granules) > 0:
-        granule = granules.pop()
+    # the pattern is compiled once, rather than looked up for every granule
+    target_granule_id_regex = _re.compile(target_granule_id_pattern)
 
+    # the granules may be shared between members, so they're
+    # read back-to-front rather than popped off of the list
+    matching_granule = None
+    for granule in reversed(granules):
         if granule['granuleClass'] != 'CONGRESSMEMBERSTATE':
             continue
 
         granule_id = granule['granuleId']
 
-        if not _re.match(target_granule_id_pattern, granule_id):
+        if not target_granule_id_regex.match(granule_id):
             continue
 
         endpoint = \
             _granule_endpoint(api_key, package_id, granule_id)
         granule_text = _get_text_from(endpoint)
-        granule_summary = _json.loads(granule_text)
+        granule_summary = _orjson.loads(granule_text)
 
-        try:
-            bioguide_id = granule_summary['members'][0]['bioGuideId']
-        except KeyError:
-            continue
+        granule_members = granule_summary.get('members')
+        bioguide_id = \
+            granule_members[0].get('bioGuideId') if granule_members else None
 
         if bioguide_id != target_bioguide_id:
             continue
@@ -390,117 +480,83 @@ def _get_cdir(api_key: str, congress: int) -> Optional[GovInfoCongressRecord]:
 
     # granules are header records within a package
     granules = _granules(api_key, package_id)
-    granule_endpoints = []
-    for granule in granules:
-        if granule['granuleClass'] != 'CONGRESSMEMBERSTATE':
-            continue
-        granule_id = granule['granuleId']
-        endpoint = _granule_endpoint(api_key, package_id, granule_id)
-        granule_endpoints.append(endpoint)
+    granule_endpoints = \
+        [(granule['granuleId'],
+          _granule_endpoint(api_key, package_id, granule['granuleId']))
+         for granule in granules
+         if granule['granuleClass'] == 'CONGRESSMEMBERSTATE']
 
     # the details of each granule are contained within its summary
-    granule_text_data = []
-
-    threading = True
+    def get_member_granule_summary(granule_endpoint):
+        granule_id, endpoint = granule_endpoint
+
+        # a published directory doesn't change,
+        # so any cached summary can be reused
+        granule_text = _cache.get_text(_cache.GOVINFO, granule_id)
+        if granule_text is not None:
+            granule_summary = _orjson.loads(granule_text)
+        else:
+            response = _get_response_from(endpoint)
+            granule_summary = _orjson.loads(response.text)
 
-    def _get_granule_summaries_concurrently():
-        while threading:
-            granule_endpoint = q.get()
-            if granule_endpoint:
-                granule_text = _get_text_from(granule_endpoint)
-                granule_text_data.append(granule_text)
-                q.task_done()
+            # only successful responses are cached, so that error
+            # bodies (like rate limits) aren't reused on later runs
+            if response.ok:
+                _cache.put_text(_cache.GOVINFO, granule_id, response.text)
 
-    q = Queue(_util.NUMBER_OF_THREADS * 2)
-    for _ in range(_util.NUMBER_OF_THREADS):
-        t = Thread(target=_get_granule_summaries_concurrently)
-        t.daemon = True
-        t.start()
+        # filter as each summary arrives, so that only the
+        # member summaries are held rather than every response
+        subgranule_class = granule_summary.get('subGranuleClass')
+        if subgranule_class in _MEMBER_SUBGRANULE_CLASSES:
+            return granule_summary
+        return None
 
     try:
-        for endpoint in granule_endpoints:
-            q.put(endpoint)
-        q.join()
+        granule_summaries = \
+            list(_EXECUTOR.map(get_member_granule_summary, granule_endpoints))
     except KeyboardInterrupt:
         _sys.exit(1)
 
-    threading = False
-    for _ in range(_util.NUMBER_OF_THREADS):
-        q.put(None)
-
-    granule_data = []
-    for granule_text in granule_text_data:
-        granule_summary = _json.loads(granule_text)
-
-        subgranule_class = granule_summary.get('subGranuleClass')
-        is_target_subgranule_class = \
-            bool(subgranule_class in ('SENATOR', 'REPRESENTATIVE',
-                                      'DELEGATE', 'RESIDENTCOMMISSIONER'))
-
-        if is_target_subgranule_class:
-            granule_data.append(granule_summary)
+    granule_data = [granule_summary for granule_summary in granule_summaries
+                    if granule_summary is not None]
 
     return GovInfoCongressRecord(congress, start_year, end_year, granule_data)
 
 
 def _get_bills(api_key: str, congress: int):
-    package_endpoints = []
     if _index.exists_in_bills_index(congress):
         package_ids = _index.lookup_package_ids(congress)
-        for package_id in package_ids:
-            relative_endpoint = _package_summary_endpoint(api_key, package_id)
-            endpoint = _endpoint_url(relative_endpoint)
-            package_endpoints.append(endpoint)
+        package_endpoints = \
+            [_endpoint_url(_package_summary_endpoint(api_key, package_id))
+             for package_id in package_ids]
     else:
         packages = _bill_packages_by_congress(api_key, congress)
-        package_endpoints = [f'{p["packageLink"]}?api_key={api_key}'
-                             for p in packages]
-
-    package_text_data = []
-
-    threading = True
-
-    def _get_text_concurrently():
-        while threading:
-            package_endpoint = q.get()
-            if package_endpoint:
-                package_text = _get_text_from(package_endpoint)
-                package_text_data.append(package_text)
-                q.task_done()
-
-    q = Queue(_util.NUMBER_OF_THREADS * 2)
-    for _ in range(_util.NUMBER_OF_THREADS):
-        t = Thread(target=_get_text_concurrently)
-        t.daemon = True
-        t.start()
+        query_string = _query_string(api_key=api_key)
+        package_endpoints = [package['packageLink'] + query_string
+                             for package in packages]
 
     try:
-        for endpoint in package_endpoints:
-            q.put(endpoint)
-        q.join()
+        package_text_data = \
+            list(_EXECUTOR.map(_get_text_from, package_endpoints))
     except KeyboardInterrupt:
         _sys.exit(1)
 
-    # clean up threads
-    threading = False
-    for _ in range(_util.NUMBER_OF_THREADS):
-        q.put(None)
-
-    bill_records = []
-    for package_text in package_text_data:
-        package_json = _json.loads(package_text)
-        bill_records.append(GovInfoBillRecord(package_json, api_key))
-
-    return bill_records
+    return [GovInfoBillRecord(_orjson.loads(package_text), api_key)
+            for package_text in package_text_data]
 
 
 def _packages_by_congress(api_key: str, congress: int) -> List[Dict[str, Any]]:
     """Returns a list of packages for a given collection"""
+    # every page is requested as of the same time, so that packages
+    # modified partway through can't shift the pages
+    end_date = _current_datetime()
+
     header_endpoint = _collection_endpoint(api_key, 'CDIR',
+                                           end_date=end_date,
                                            offset=0, page_size=1,
                                            congress=str(congress))
     header_text = _get_text_from(header_endpoint)
-    header = _json.loads(header_text)
+    header = _orjson.loads(header_text)
 
     try:
         package_count = int(header['count'])
@@ -508,46 +564,20 @@ def _packages_by_congress(api_key: str, congress: int) -> List[Dict[str, Any]]:
         raise Exception(header.dumps())
 
     collection_endpoints = [_collection_endpoint(api_key, 'CDIR',
+                                                 end_date=end_date,
                                                  offset=n, page_size=100,
                                                  congress=str(congress))
                             for n in range(0, package_count, 100)]
 
-    collection_text_data = []
-
-    threading = True
-
-    def _get_collections_concurrently():
-        while threading:
-            collection_endpoint = q.get()
-            if collection_endpoint:
-                collection_text = _get_text_from(collection_endpoint)
-                collection_text_data.append(collection_text)
-                q.task_done()
-
-    q = Queue(_util.NUMBER_OF_THREADS * 2)
-    for _ in range(_util.NUMBER_OF_THREADS):
-        t = Thread(target=_get_collections_concurrently)
-        t.daemon = True
-        t.start()
-
     try:
-        for collection_endpoint in collection_endpoints:
-            q.put(collection_endpoint)
-        q.join()
+        collection_text_data = \
+            list(_EXECUTOR.map(_get_text_from, collection_endpoints))
     except KeyboardInterrupt:
         _sys.exit(1)
 
-    # clean up threads
-    threading = False
-    for _ in range(_util.NUMBER_OF_THREADS):
-        q.put(None)
-
-    packages = []
-    for collection_text in collection_text_data:
-        collection = _json.loads(collection_text)
-        packages = packages + collection['packages']
-
-    return packages
+    return [package
+            for collection_text in collection_text_data
+            for package in _orjson.loads(collection_text)['packages']]
 
 
 def _bill_packages_by_congress(api_key: str,
@@ -568,7 +598,7 @@ def _bill_packages_by_congress(api_key: str,
                                     page_size=1,
                                     congress=str(congress))
     collection_text = _get_text_from(endpoint)
-    collection = _json.loads(collection_text)
+    collection = _orjson.loads(collection_text)
 
     try:
         total_package_count = int(collection['count'])
@@ -594,7 +624,7 @@ def _bill_packages_by_congress(api_key: str,
                                             congress=str(congress),
                                             doc_class=doc_class)
             collection_text = _get_text_from(endpoint)
-            collection = _json.loads(collection_text)
+            collection = _orjson.loads(collection_text)
 
             try:
                 doc_class_package_count = int(collection['count'])
@@ -610,7 +640,7 @@ def _bill_packages_by_congress(api_key: str,
                                                            congress=congress,
                                                            doc_class=doc_class)
 
-            packages = packages + doc_class_packages
+            packages.extend(doc_class_packages)
 
         year -= 1
 
@@ -707,7 +737,7 @@ def _search_for_bill_packages(depth, start, stop, **kwargs):
                                         doc_class=doc_class)
 
         collection_text = _get_text_from(endpoint)
-        collection = _json.loads(collection_text)
+        collection = _orjson.loads(collection_text)
 
         try:
             unit_package_count = int(collection['count'])
@@ -720,13 +750,12 @@ def _search_for_bill_packages(depth, start, stop, **kwargs):
         elif unit_package_count > 9999:
             start_date = unformat_func(start)
             stop_date = unformat_func(stop)
-            packages = \
-                packages + _search_for_bill_packages(depth + 1,
-                                                     start_date,
-                                                     stop_date,
-                                                     api_key=api_key,
-                                                     congress=congress,
-                                                     doc_class=doc_class)
+            packages.extend(_search_for_bill_packages(depth + 1,
+                                                      start_date,
+                                                      stop_date,
+                                                      api_key=api_key,
+                                                      congress=congress,
+                                                      doc_class=doc_class))
         else:
             offset = 0
             pages = 1
@@ -740,7 +769,7 @@ def _search_for_bill_packages(depth, start, stop, **kwargs):
                                                 congress=str(congress),
                                                 doc_class=doc_class)
                 collection_text = _get_text_from(endpoint)
-                collection = _json.loads(collection_text)
+                collection = _orjson.loads(collection_text)
 
                 try:
                     unit_package_count = int(collection['count'])
@@ -750,13 +779,13 @@ def _search_for_bill_packages(depth, start, stop, **kwargs):
                 if unit_package_count == 0:
                     break
 
-                unit_packages = unit_packages + collection['packages']
+                unit_packages.extend(collection['packages'])
                 if unit_package_count > pages * page_size:
                     pages = _math.ceil(unit_package_count / page_size)
 
                 offset += page_size
 
-            packages = packages + unit_packages
+            packages.extend(unit_packages)
 
     return packages
 
@@ -765,7 +794,7 @@ def _granules(api_key: str, package_id: str) -> List[dict]:
     """Returns a list of granules for a given package"""
     header_endpoint = _package_granules_endpoint(api_key, package_id, 0, 1)
     header_text = _get_text_from(header_endpoint)
-    header = _json.loads(header_text)
+    header = _orjson.loads(header_text)
 
     try:
         granule_count = int(header['count'])
@@ -776,74 +805,59 @@ def _granules(api_key: str, package_id: str) -> List[dict]:
         [_package_granules_endpoint(api_key, package_id, n, 100)
          for n in range(0, granule_count, 100)]
 
-    granule_text_data = []
-
-    threading = True
-
-    def _get_granule_text_concurrently():
-        while threading:
-            granule_endpoint = q.get()
-            if granule_endpoint:
-                granule_text = _get_text_from(granule_endpoint)
-                granule_text_data.append(granule_text)
-                q.task_done()
-
-    q = Queue(_util.NUMBER_OF_THREADS * 2)
-    for _ in range(_util.NUMBER_OF_THREADS):
-        t = Thread(target=_get_granule_text_concurrently)
-        t.daemon = True
-        t.start()
-
     try:
-        for granule_endpoint in granule_endpoints:
-            q.put(granule_endpoint)
-        q.join()
+        granule_text_data = \
+            list(_EXECUTOR.map(_get_text_from, granule_endpoints))
     except KeyboardInterrupt:
         _sys.exit(1)
 
-    # clean up threads
-    threading = False
-    for _ in range(_util.NUMBER_OF_THREADS):
-        q.put(None)
-
-    granules = []
-    for granule_text in granule_text_data:
-        granule_container = _json.loads(granule_text)
-        granules = granules + granule_container['granules']
-
-    return granules
+    return [granule
+            for granule_text in granule_text_data
+            for granule in _orjson.loads(granule_text)['granules']]
 
 
 def _packages(api_key: str, collection_code: str) -> List[dict]:
     """Returns a list of packages for a given collection"""
-    offset = 0
     page_size = 100
-    pages = 1
-    packages = []
-    while offset < pages * page_size:
-        endpoint = _collection_endpoint(api_key, collection_code,
-                                        offset=offset, page_size=page_size)
-        collection_text = _get_text_from(endpoint)
-        collection = _json.loads(collection_text)
-        packages = packages + collection['packages']
+    end_date = _current_datetime()
 
-        try:
-            package_count = collection['count']
-        except KeyError:
-            raise Exception(collection.dumps())
+    # the first page gives the package count, after which
+    # the remaining pages are requested all at once
+    endpoint = _collection_endpoint(api_key, collection_code,
+                                    end_date=end_date,
+                                    offset=0, page_size=page_size)
+    collection = _orjson.loads(_get_text_from(endpoint))
 
-        if package_count > pages * page_size:
-            pages = _math.ceil(package_count / page_size)
+    try:
+        package_count = collection['count']
+    except KeyError:
+        raise Exception(_orjson.dumps(collection).decode('utf-8'))
+
+    packages = list(collection['packages'])
 
-        offset += page_size
+    collection_endpoints = [_collection_endpoint(api_key, collection_code,
+                                                 end_date=end_date,
+                                                 offset=n,
+                                                 page_size=page_size)
+                            for n in range(page_size, package_count,
+                                           page_size)]
+
+    try:
+        collection_text_data = \
+            list(_EXECUTOR.map(_get_text_from, collection_endpoints))
+    except KeyboardInterrupt:
+        _sys.exit(1)
 
+    packages.extend(package
+                    for collection_text in collection_text_data
+                    for package in _orjson.loads(collection_text)['packages'])
     return packages
 
 
 def _collections(api_key: str) -> List[dict]:
     """Returns a list of collections"""
     collections_text = _get_text_from(_collections_endpoint(api_key))
-    collections_container = _json.loads(collections_text)
+    collections_container = _orjson.loads(collections_text)
     return collections_container['collections']
 
 
@@ -852,28 +866,31 @@ def _collections(api_key: str) -> List[dict]:
 
 def _get_text_from(endpoint: str) -> str:
     """Uses an HTTP GET request to retrieve text from a given endpoint"""
-    response_text = None
+    return _get_response_from(endpoint).text
+
+
+def _get_response_from(endpoint: str) -> _requests.Response:
+    """Uses an HTTP GET request to retrieve a response from a given
+    endpoint"""
+    # failed connections and gateway errors are retried by the session;
+    # GovInfo also answers 404 for some documents that later succeed
     attempts = 0
     while True:
-        try:
-            response = _requests.get(_endpoint_url(endpoint))
-            response_text = response.text
+        response = _session.get(_endpoint_url(endpoint))
 
-            if response.status_code == 500:
-                raise _error.GovinfoInternalServerError(endpoint)
+        if response.status_code == 500:
+            raise _error.GovinfoInternalServerError(endpoint)
 
-            if response.status_code in (404, 504):
-                raise _requests.exceptions.ConnectionError()
+        if response.status_code == 404 \
+                and attempts < _util.MAX_REQUEST_ATTEMPTS:
+            attempts += 1
+            _time.sleep(2 * attempts)
+            continue
 
-            break
-        except _requests.exceptions.ConnectionError:
-            if attempts < _util.MAX_REQUEST_ATTEMPTS:
-                attempts += 1
-                _time.sleep(2 * attempts)
-                continue
-            raise
+        if response.status_code in (404, 504):
+            raise _requests.exceptions.ConnectionError()
 
-    return response_text
+        return response
 
 
 def _collections_endpoint(api_key: str) -> str:
@@ -971,16 +988,14 @@ def _endpoint_url(endpoint) -> str:
 
 
 def _query_string(**kwargs) -> str:
-    """Creates a query string from given keywords"""
-    args = kwargs.items()
-    return '?' + ('&'.join([key + '=' + str(val) for key, val in args]))
+    """Creates a query string from given keywords, escaping any
+    characters that aren't allowed in a URL"""
+    return '?' + _urlencode(kwargs)
 
 
 def _current_datetime() -> str:
     """Returns the current time formatted as yyyy-MM-ddThh:mm:ssZ"""
-    now = _dt.datetime.now()
-    return _utc_timestamp_from_parts(now.year, now.month, now.day,
-                                     now.hour, now.minute, now.second)
+    return _dt.datetime.now().strftime('%Y-%m-%dT%H:%M:%SZ')
 
 
 def _utc_timestamp_from_datetime(dt: _dt.datetime) -> str:
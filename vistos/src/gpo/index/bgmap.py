@@ -1,5 +1,7 @@
 """A module for storing bioguide data locally to speed up query times"""
+import functools
 import os
+from typing import Dict, List
 
 import vistos.src.gpo.util as util
 
@@ -16,92 +18,64 @@ BILLS_BGMAP_PATH = (os.path.dirname(os.path.realpath(__file__))
 def exists_in_congress_index(congress_number: int):
     """Returns True if a given congress number exists in the congress bgmap
     files"""
-
-    for _, _, file_names in os.walk(CONGRESS_BGMAP_PATH):
-        for name in file_names:
-            try:
-                num = name.split('.')[0]
-                num = num.replace('_', '')
-                if int(num) == congress_number:
-                    return True
-
-            except (IndexError, ValueError, TypeError):
-                continue
-
-    return False
+    return congress_number in _index_file_paths(CONGRESS_BGMAP_PATH)
 
 
 def exists_in_bills_index(congress_number: int):
     """Returns True if a given congress number exists in the congress bgmap
     files"""
-
-    for _, _, file_names in os.walk(BILLS_BGMAP_PATH):
-        for name in file_names:
-            try:
-                num = name.split('.')[0]
-                num = num.replace('_', '')
-                if int(num) == congress_number:
-                    return True
-
-            except (IndexError, ValueError, TypeError):
-                continue
-
-    return False
+    return congress_number in _index_file_paths(BILLS_BGMAP_PATH)
 
 
 def lookup_package_ids(congress_number: int = None):
     """Returns the bill package IDs of a given Congress number"""
-    package_ids = []
     if congress_number is not None:
-        for path, _, file_names in os.walk(BILLS_BGMAP_PATH):
-            for name in file_names:
-                try:
-                    num = name.split('.')[0]
-                    num = num.replace('_', '')
-                    if int(num) == congress_number:
-                        with open(path + '/' + name) as bgmap:
-                            lines = bgmap.readlines()
-                            package_ids = [ln.replace('\n', '')
-                                           for ln in lines]
-
-                except (IndexError, ValueError, TypeError):
-                    continue
-    else:
-        all_package_ids = set()
-        current_congress = util.get_current_congress_number()
-        for congress in range(0, current_congress + 1):
-            pkg_ids = lookup_bioguide_ids(congress)
-            all_package_ids = all_package_ids.union(pkg_ids)
-
-        return list(all_package_ids)
-
-    return package_ids
+        return _read_index_file(BILLS_BGMAP_PATH, congress_number)
+
+    all_package_ids = set()
+    current_congress = util.get_current_congress_number()
+    for congress in range(0, current_congress + 1):
+        pkg_ids = lookup_package_ids(congress)
+        all_package_ids = all_package_ids.union(pkg_ids)
+
+    return list(all_package_ids)
 
 
 def lookup_bioguide_ids(congress_number: int = None):
     """Returns the bioguide IDs of a given Congress number"""
-    bioguide_ids = []
     if congress_number is not None:
-        for path, _, file_names in os.walk(CONGRESS_BGMAP_PATH):
-            for name in file_names:
-                try:
-                    num = name.split('.')[0]
-                    num = num.replace('_', '')
-                    if int(num) == congress_number:
-                        with open(path + '/' + name) as bgmap:
-                            lines = bgmap.readlines()
-                            bioguide_ids = [ln.replace('\n', '')
-                                            for ln in lines]
-
-                except (IndexError, ValueError, TypeError):
-                    continue
-    else:
-        all_bioguide_ids = set()
-        current_congress = util.get_current_congress_number()
-        for congress in range(0, current_congress + 1):
-            bg_ids = lookup_bioguide_ids(congress)
-            all_bioguide_ids = all_bioguide_ids.union(bg_ids)
-
-        return list(all_bioguide_ids)
-
-    return bioguide_ids
+        return _read_index_file(CONGRESS_BGMAP_PATH, congress_number)
+
+    all_bioguide_ids = set()
+    current_congress = util.get_current_congress_number()
+    for congress in range(0, current_congress + 1):
+        bg_ids = lookup_bioguide_ids(congress)
+        all_bioguide_ids = all_bioguide_ids.union(bg_ids)
+
+    return list(all_bioguide_ids)
+
+
+def _read_index_file(index_path: str, congress_number: int) -> List[str]:
+    """Returns the lines of the index file for a given Congress number"""
+    file_path = _index_file_paths(index_path).get(congress_number)
+    if file_path is None:
+        return []
+
+    with open(file_path) as bgmap:
+        return [ln.replace('\n', '') for ln in bgmap.readlines()]
+
+
+@functools.lru_cache(maxsize=None)
+def _index_file_paths(index_path: str) -> Dict[int, str]:
+    """Maps Congress numbers to their files within an index directory. The
+    index files ship with the package, so the directory is only read once"""
+    file_paths = dict()
+    for path, _, file_names in os.walk(index_path):
+        for name in file_names:
+            try:
+                num = int(name.split('.')[0].replace('_', ''))
+            except ValueError:
+                continue
+            file_paths[num] = path + '/' + name
+
+    return file_paths
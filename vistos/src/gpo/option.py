@@ -1,34 +1,26 @@
 """Module for handling GPO query options"""
-from typing import Optional
+from typing import FrozenSet, Optional
 
 
 def is_valid_bioguide_position(position: Optional[str]) -> bool:
     """Returns true if the value given is a valid position"""
-    valid_positions = \
-        set(getattr(Position, p) for p in vars(Position) if p[:2] != '__')
-    return position in valid_positions
+    return position in _VALID_POSITIONS
 
 
 def is_valid_bioguide_party(party: Optional[str]) -> bool:
     """Returns true if the value given is a valid party"""
-    valid_parties = set(getattr(Party.Current, p)
-                        for p in vars(Party.Current)
-                        if p[:2] != '__')
-
-    valid_parties = valid_parties.union(set(getattr(Party.Historical, p)
-                                            for p in vars(Party.Historical)
-                                            if p[:2] != '__'))
-
-    valid_parties = valid_parties.union(set(getattr(Party.Errors, p)
-                                            for p in vars(Party.Errors)
-                                            if p[:2] != '__'))
-    return party in valid_parties
+    return party in _VALID_PARTIES
 
 
 def is_valid_bioguide_state(state: Optional[str]) -> bool:
     """Returns true if the value given is a valid state"""
-    valid_states = set(getattr(State, s) for s in vars(State) if s[:2] != '__')
-    return state in valid_states
+    return state in _VALID_STATES
+
+
+def _option_values(option_class) -> FrozenSet[str]:
+    """Returns the values of all public attributes of an option class"""
+    return frozenset(getattr(option_class, o)
+                     for o in vars(option_class) if o[:2] != '__')
 
 
 class Bill:
@@ -80,7 +72,7 @@ class Party:
         ADAMS_CLAY_REPUBLICAN = 'Adams-Clay Republican'
         ALLIANCE = 'Alliance'
         AMERICAN = 'American'
-        AMERICAN = 'American (Know-Nothing)'
+        AMERICAN_KNOW_NOTHING = 'American (Know-Nothing)'
         AMERICAN_LABORITE = 'American Laborite'
         AMERICAN_PARTY = 'American Party'
         ANTI_ADMINISTRATION = 'Anti-Administration'
@@ -160,7 +152,7 @@ class State:
     """All states and territories, current and historical"""
     ALASKA = 'AK'
     ALABAMA = 'AL'
-    ARKANSAS = 'AK'
+    ARKANSAS = 'AR'
     AMERICAN_SAMOA = 'AS'
     ARIZONA = 'AZ'
     CALIFORNIA = 'CA'
@@ -174,7 +166,9 @@ class State:
     GUAM = 'GU'
     HAWAII = 'HI'
     IOWA = 'IA'
-    IDAHO = 'IN'
+    IDAHO = 'ID'
+    ILLINOIS = 'IL'
+    INDIANA = 'IN'
     KANSAS = 'KS'
     KENTUCKY = 'KY'
     LOUISIANA = 'LA'
@@ -186,7 +180,7 @@ class State:
     MISSOURI = 'MO'
     NORTHERN_MARIANA_ISLANDS = 'MP'
     MISSISSIPPI = 'MS'
-    MONTANA = 'MN'
+    MONTANA = 'MT'
     NORTH_CAROLINA = 'NC'
     NORTH_DAKOTA = 'ND'
     NEBRASKA = 'NE'
@@ -216,3 +210,11 @@ class State:
     WEST_VIRGINIA = 'WV'
     WYOMING = 'WY'
     UNITED_STATES = 'US'
+
+
+# the options never change, so build the lookup sets once at import
+_VALID_POSITIONS = _option_values(Position)
+_VALID_PARTIES = (_option_values(Party.Current)
+                  | _option_values(Party.Historical)
+                  | _option_values(Party.Errors))
+_VALID_STATES = _option_values(State)
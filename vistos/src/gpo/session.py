@@ -0,0 +1,67 @@
+"""A module for sharing pooled HTTP connections across GPO requests"""
+import threading as _threading
+
+import requests as _requests
+from requests.adapters import HTTPAdapter as _HTTPAdapter
+from urllib3.util.retry import Retry as _Retry
+
+from vistos.src.gpo import util as _util
+
+# the most connections kept open to a single host; requests beyond this
+# still go through, but their connections aren't kept for reuse
+POOL_SIZE = 64
+
+# failed connections and gateway errors are retried with a growing delay
+# between attempts. The search form is the only POST sent, and it's safe to
+# repeat. Once out of attempts, the last error response is returned so that
+# callers can handle its status
+_RETRY = _Retry(total=_util.MAX_REQUEST_ATTEMPTS,
+                backoff_factor=1,
+                status_forcelist=(502, 503, 504),
+                allowed_methods=_Retry.DEFAULT_ALLOWED_METHODS | {'POST'},
+                raise_on_status=False)
+
+_session = None
+_session_lock = _threading.Lock()
+
+
+def get_session() -> _requests.Session:
+    """Returns the shared session, creating it on first use"""
+    global _session
+
+    session = _session
+    if session is None:
+        with _session_lock:
+            if _session is None:
+                _session = create_session()
+            session = _session
+
+    return session
+
+
+def close_session():
+    """Closes any pooled connections. A new session is created the next time
+    a request is sent"""
+    global _session
+
+    with _session_lock:
+        session, _session = _session, None
+
+    if session is not None:
+        session.close()
+
+
+def get(url: str, **kwargs) -> _requests.Response:
+    """Sends an HTTP GET request through the shared session"""
+    return get_session().get(url, **kwargs)
+
+
+def create_session() -> _requests.Session:
+    """Creates a session that keeps connections alive between requests and
+    retries failed requests. Unlike the shared session, it can hold cookies
+    meant for one sequence of requests"""
+    session = _requests.Session()
+    adapter = _HTTPAdapter(pool_maxsize=POOL_SIZE, max_retries=_RETRY)
+    session.mount('https://', adapter)
+    session.mount('http://', adapter)
+    return session
@@ -2,8 +2,8 @@
 
 import datetime as _dt
 import re as _re
-import multiprocessing as _mp
-from typing import Set, Tuple, List, Optional
+import os as _os
+from typing import FrozenSet, Tuple, List, Optional
 
 
 BIOGUIDERETRO_SEARCH_URL_STR = \
@@ -13,10 +13,19 @@ BIOGUIDERETRO_ROOT_URL_STR = \
 BIOGUIDERETRO_MEMBER_XML_URL = \
     'https://bioguideretro.congress.gov/Static_Files/data/'
 
+# preformatted templates for URLs built once per member or page
+BIOGUIDERETRO_MEMBER_XML_URL_FMT = BIOGUIDERETRO_MEMBER_XML_URL + '{0}/{1}.xml'
+BIOGUIDERETRO_SEARCH_PAGE_URL_FMT = BIOGUIDERETRO_SEARCH_URL_STR + '?page={0}'
+
 GOVINFO_API_URL_STR = 'https://api.govinfo.gov'
 
 MAX_REQUEST_ATTEMPTS = 3
-NUMBER_OF_THREADS = _mp.cpu_count()
+# os.cpu_count() gives the same count as multiprocessing.cpu_count()
+# without importing multiprocessing, but may return None
+NUMBER_OF_THREADS = _os.cpu_count() or 1
+# downloads spend most of their time waiting on the network rather than the
+# CPU, so more of them are kept in flight than there are CPUs
+NUMBER_OF_REQUEST_THREADS = max(16, NUMBER_OF_THREADS)
 
 
 def first_valid_year() -> int:
@@ -42,13 +51,11 @@ def all_congress_terms() -> List[Tuple[int, int]]:
 def get_current_congress_number() -> int:
     """Returns the number of the active
     congress, based on the current date"""
-    current_year = _dt.datetime.now().year
-    current_month = _dt.datetime.now().month
-    current_day = _dt.datetime.now().day
+    now = _dt.datetime.now()
 
-    congresses = get_congress_numbers(current_year)
+    congresses = get_congress_numbers(now.year)
 
-    if current_month == 1 and current_day < 3:
+    if now.month == 1 and now.day < 3:
         return min(congresses)
 
     return max(congresses)
@@ -85,14 +92,11 @@ def convert_to_congress_number(number_or_year: Optional[int]) -> int:
     return 0
 
 
-def get_congress_numbers(year: int) -> Set:
+def get_congress_numbers(year: int) -> FrozenSet[int]:
     """Returns the congress numbers associated with a given year"""
-    congress_numbers = set()
-    for number, years in _NUMBER_YEAR_MAPPING.items():
-        if years[1] >= year >= years[0]:
-            congress_numbers.add(number)
-
-    return congress_numbers
+    # the result is shared, so it's a frozenset
+    # to keep callers from modifying it
+    return _YEAR_CONGRESS_NUMBERS.get(year, frozenset())
 
 
 def get_congress_years(number: int) -> Tuple:
@@ -114,10 +118,18 @@ def get_end_year(number: int) -> int:
 def get_year_range_by_year(year: int) -> Optional[Tuple[int, int]]:
     """Returns the start and end years of the
     term to which the given year belongs"""
-    # iterate in reverse to get most recent term
-    for years in list(_NUMBER_YEAR_MAPPING.values())[::-1]:
-        if years[1] >= year >= years[0]:
-            return years
+    return _YEAR_RANGES.get(year)
+
+
+# negation of valid characters
+_INVALID_XML_CHAR_PATTERN = \
+    _re.compile(r'[^a-zA-Z0-9\s~`!@#$%^&*()_+=:{}[;<,>.?/\\\-\]\"\']')
+
+# the same characters as a deletion table, for removing them from ASCII text
+# without going through the regex engine
+_INVALID_ASCII_XML_CHARS = \
+    {code: None for code in range(128)
+     if _INVALID_XML_CHAR_PATTERN.match(chr(code))}
 
 
 class Text:
@@ -125,16 +137,16 @@ class Text:
     @staticmethod
     def clean_xml(text: str):
         """Removes invalid characters from XML"""
-        # negation of valid characters
-        invalid_char = r'[^a-zA-Z0-9\s~`!@#$%^&*()_+=:{}[;<,>.?/\\\-\]\"\']'
-        clean_text = _re.sub(invalid_char, '', text)
-        return clean_text
+        if text.isascii():
+            return text.translate(_INVALID_ASCII_XML_CHARS)
+        return _INVALID_XML_CHAR_PATTERN.sub('', text)
 
     @staticmethod
     def fix_last_name_casing(name: str) -> str:
         """Converts uppercase text to capitalized"""
         # Addresses name prefixes, like "Mc-" or "La-"
-        if _re.match(r'^[A-Z][a-z][A-Z]', name):
+        if len(name) >= 3 and 'A' <= name[0] <= 'Z' \
+                and 'a' <= name[1] <= 'z' and 'A' <= name[2] <= 'Z':
             start_pos = 3
         else:
             start_pos = 1
@@ -296,3 +308,24 @@ _NUMBER_YEAR_MAPPING = {
     149: (2085, 2087),
     150: (2087, 2089)
 }
+
+
+def _index_years(number_year_mapping: dict) -> Tuple[dict, dict]:
+    """Maps each year to the numbers of the congresses in session during it,
+    and to the years of the most recent of those terms"""
+    year_numbers = dict()
+    year_ranges = dict()
+
+    # the terms are in order, so later terms replace earlier ranges
+    for number, years in number_year_mapping.items():
+        for year in range(years[0], years[1] + 1):
+            year_numbers.setdefault(year, set()).add(number)
+            year_ranges[year] = years
+
+    year_numbers = {year: frozenset(numbers)
+                    for year, numbers in year_numbers.items()}
+    return year_numbers, year_ranges
+
+
+# the mapping never changes, so the lookups by year are built once
+_YEAR_CONGRESS_NUMBERS, _YEAR_RANGES = _index_years(_NUMBER_YEAR_MAPPING)